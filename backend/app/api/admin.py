@@ -2,27 +2,39 @@
 Admin API endpoints.
 """
 import re
-from datetime import datetime, timezone
-from typing import Annotated, List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Annotated, AsyncGenerator, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query, status, Request
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, status, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, field_validator
-from sqlalchemy import select, func
+import redis.asyncio as aioredis
+from sqlalchemy import BigInteger, cast, select, func, insert, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer, selectinload
 import structlog
 
-from app.core.database import get_db
-from app.core.security import hash_password
+from app.core.database import get_db, async_session_maker, execute_concurrently
+from app.core.redis import get_redis, SETTINGS_INVALIDATE_CHANNEL
+from app.core.security import hash_password_async
 from app.models.user import User, UserRole
 from app.models.mirror import Mirror, MirrorType, MirrorStatus
-from app.models.sync_job import SyncJob, SyncStatus
+from app.models.sync_job import SyncJob, SyncStatus, SYNC_JOBS_CHANNEL
 from app.models.audit_log import AuditLog
 from app.models.setting import Setting
-from app.api.auth import require_admin, require_operator, get_current_user, create_audit_log
+from app.api.auth import (
+    require_admin,
+    require_operator,
+    get_current_user,
+    create_audit_log,
+    invalidate_user_cache,
+)
 
 logger = structlog.get_logger(__name__)
 router = APIRouter()
 
+_UPSTREAM_URL_RE = re.compile(r"^(?:rsync|https?)://")
+
 
 # Pydantic models
 class UserCreateRequest(BaseModel):
@@ -60,10 +72,10 @@ class MirrorUpdateRequest(BaseModel):
     def validate_upstream_url(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
-        if not re.match(r"^(rsync|https?)://", v):
-            raise ValueError("upstream_url must start with rsync://, http://, or https://")
         if len(v) > 500:
             raise ValueError("upstream_url must be 500 characters or fewer")
+        if not _UPSTREAM_URL_RE.match(v):
+            raise ValueError("upstream_url must start with rsync://, http://, or https://")
         return v
 
 
@@ -93,8 +105,19 @@ async def list_users(
     db: AsyncSession = Depends(get_db)
 ) -> List[UserResponse]:
     """List all users (admin only)."""
-    result = await db.execute(select(User).order_by(User.created_at.desc()))
-    return result.scalars().all()
+    # Select only response columns so rows skip ORM instance construction
+    result = await db.execute(
+        select(
+            User.id,
+            User.username,
+            User.email,
+            User.role,
+            User.is_active,
+            User.created_at,
+            User.last_login,
+        ).order_by(User.created_at.desc())
+    )
+    return [dict(row) for row in result.mappings()]
 
 
 @router.post("/users", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
@@ -115,20 +138,22 @@ async def create_user(
             detail="Username already exists"
         )
 
-    # Create user
-    user = User(
-        username=user_data.username,
-        email=user_data.email,
-        password_hash=hash_password(user_data.password),
-        role=user_data.role
+    # Create user; RETURNING loads server defaults without a refresh query
+    result = await db.execute(
+        insert(User)
+        .values(
+            username=user_data.username,
+            email=user_data.email,
+            password_hash=await hash_password_async(user_data.password),
+            role=user_data.role
+        )
+        .returning(User)
     )
-    db.add(user)
+    user = result.scalar_one()
     await db.commit()
-    await db.refresh(user)
 
     logger.info("User created", user_id=user.id, created_by=current_user.id)
-    await create_audit_log(
-        db=db,
+    create_audit_log(
         user_id=current_user.id,
         action="user_created",
         resource_type="user",
@@ -146,11 +171,11 @@ async def update_user(
     user_id: Annotated[int, Path(gt=0)],
     user_data: UserUpdateRequest,
     current_user: Annotated[User, Depends(require_admin)],
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    redis_client: aioredis.Redis = Depends(get_redis)
 ) -> User:
     """Update a user (admin only)."""
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    user = await db.get(User, user_id)
 
     if not user:
         raise HTTPException(
@@ -176,11 +201,13 @@ async def update_user(
         user.is_active = user_data.is_active
         changes["is_active"] = user_data.is_active
 
+    if not changes:
+        return user
+
     await db.commit()
-    await db.refresh(user)
+    await invalidate_user_cache(redis_client, user_id)
 
-    await create_audit_log(
-        db=db,
+    create_audit_log(
         user_id=current_user.id,
         action="user_updated",
         resource_type="user",
@@ -197,7 +224,8 @@ async def delete_user(
     request: Request,
     user_id: Annotated[int, Path(gt=0)],
     current_user: Annotated[User, Depends(require_admin)],
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    redis_client: aioredis.Redis = Depends(get_redis)
 ) -> None:
     """Delete a user (admin only)."""
     if user_id == current_user.id:
@@ -206,8 +234,7 @@ async def delete_user(
             detail="Cannot delete yourself"
         )
 
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    user = await db.get(User, user_id)
 
     if not user:
         raise HTTPException(
@@ -218,9 +245,9 @@ async def delete_user(
     username = user.username
     await db.delete(user)
     await db.commit()
+    await invalidate_user_cache(redis_client, user_id)
 
-    await create_audit_log(
-        db=db,
+    create_audit_log(
         user_id=current_user.id,
         action="user_deleted",
         resource_type="user",
@@ -243,8 +270,7 @@ async def update_mirror(
     db: AsyncSession = Depends(get_db)
 ) -> dict:
     """Update mirror configuration (operator+)."""
-    result = await db.execute(select(Mirror).where(Mirror.id == mirror_id))
-    mirror = result.scalar_one_or_none()
+    mirror = await db.get(Mirror, mirror_id)
 
     if not mirror:
         raise HTTPException(
@@ -260,10 +286,12 @@ async def update_mirror(
         mirror.upstream_url = mirror_data.upstream_url
         changes["upstream_url"] = mirror_data.upstream_url
 
+    if not changes:
+        return {"message": "Mirror updated", "changes": changes}
+
     await db.commit()
 
-    await create_audit_log(
-        db=db,
+    create_audit_log(
         user_id=current_user.id,
         action="mirror_updated",
         resource_type="mirror",
@@ -283,8 +311,7 @@ async def trigger_sync(
     db: AsyncSession = Depends(get_db)
 ) -> dict:
     """Trigger a manual sync for a mirror (operator+)."""
-    result = await db.execute(select(Mirror).where(Mirror.id == mirror_id))
-    mirror = result.scalar_one_or_none()
+    mirror = await db.get(Mirror, mirror_id)
 
     if not mirror:
         raise HTTPException(
@@ -311,11 +338,12 @@ async def trigger_sync(
         triggered_by=current_user.username
     )
     db.add(sync_job)
+    await db.flush()
+    # NOTIFY is transactional: the sync service is woken once the job commits
+    await db.execute(select(func.pg_notify(SYNC_JOBS_CHANNEL, str(sync_job.id))))
     await db.commit()
-    await db.refresh(sync_job)
 
-    await create_audit_log(
-        db=db,
+    create_audit_log(
         user_id=current_user.id,
         action="sync_triggered",
         resource_type="mirror",
@@ -331,6 +359,9 @@ async def trigger_sync(
 # Sync Job Logs
 # ===========================================
 
+LOG_CHUNK_SIZE = 65536  # characters per SUBSTRING round-trip
+
+
 class SyncJobLogResponse(BaseModel):
     id: int
     mirror_id: int
@@ -339,21 +370,19 @@ class SyncJobLogResponse(BaseModel):
     completed_at: Optional[datetime]
     files_transferred: Optional[int]
     bytes_transferred: Optional[int]
-    rsync_output: Optional[str]
     error_message: Optional[str]
     triggered_by: Optional[str]
     created_at: datetime
 
 
-@router.get("/sync-jobs/{job_id}/logs", response_model=SyncJobLogResponse)
-async def get_sync_job_logs(
+@router.get("/sync-jobs/{job_id}", response_model=SyncJobLogResponse)
+async def get_sync_job(
     job_id: Annotated[int, Path(gt=0)],
     current_user: Annotated[User, Depends(get_current_user)],
     db: AsyncSession = Depends(get_db)
 ) -> SyncJobLogResponse:
-    """Get sync job details including rsync output logs."""
-    result = await db.execute(select(SyncJob).where(SyncJob.id == job_id))
-    job = result.scalar_one_or_none()
+    """Get sync job details (rsync output is served by the /logs route)."""
+    job = await db.get(SyncJob, job_id, options=[defer(SyncJob.rsync_output)])
 
     if not job:
         raise HTTPException(
@@ -369,39 +398,121 @@ async def get_sync_job_logs(
         completed_at=job.completed_at,
         files_transferred=job.files_transferred,
         bytes_transferred=job.bytes_transferred,
-        rsync_output=job.rsync_output,
         error_message=job.error_message,
         triggered_by=job.triggered_by,
         created_at=job.created_at,
     )
 
 
+async def _iter_sync_job_output(job_id: int) -> AsyncGenerator[str, None]:
+    """Yield a job's rsync output in fixed-size chunks read with SUBSTRING."""
+    # Own session: the request-scoped one is closed before streaming starts
+    async with async_session_maker() as session:
+        offset = 1
+        while True:
+            result = await session.execute(
+                select(func.substr(SyncJob.rsync_output, offset, LOG_CHUNK_SIZE))
+                .where(SyncJob.id == job_id)
+            )
+            chunk = result.scalar_one_or_none()
+            if not chunk:
+                break
+            yield chunk
+            if len(chunk) < LOG_CHUNK_SIZE:
+                break
+            offset += LOG_CHUNK_SIZE
+
+
+@router.get("/sync-jobs/{job_id}/logs", response_class=StreamingResponse)
+async def get_sync_job_logs(
+    job_id: Annotated[int, Path(gt=0)],
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: AsyncSession = Depends(get_db)
+) -> StreamingResponse:
+    """Stream a sync job's rsync output as plain text."""
+    result = await db.execute(select(SyncJob.id).where(SyncJob.id == job_id))
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Sync job not found"
+        )
+
+    return StreamingResponse(
+        _iter_sync_job_output(job_id),
+        media_type="text/plain; charset=utf-8"
+    )
+
+
 # ===========================================
 # Audit Logs
 # ===========================================
 
+# Cursor timestamps are microseconds since this epoch, so cursors are plain
+# digits and pass through a query string without URL-encoding
+_CURSOR_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _encode_audit_cursor(log: AuditLog) -> str:
+    """Encode an audit log row's (created_at, id) position as a page cursor."""
+    created_at = log.created_at
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    return f"{(created_at - _CURSOR_EPOCH) // timedelta(microseconds=1)}_{log.id}"
+
+
+def _decode_audit_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode a page cursor back into a (created_at, id) position."""
+    micros, _, log_id = cursor.partition("_")
+    try:
+        return _CURSOR_EPOCH + timedelta(microseconds=int(micros)), int(log_id)
+    except (ValueError, OverflowError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
 @router.get("/audit-logs", response_model=List[AuditLogResponse])
 async def get_audit_logs(
+    response: Response,
     current_user: Annotated[User, Depends(require_admin)],
     limit: Annotated[int, Query(ge=1, le=1000)] = 100,
-    offset: Annotated[int, Query(ge=0)] = 0,
+    cursor: Optional[str] = None,
     action: Optional[str] = None,
     db: AsyncSession = Depends(get_db)
 ) -> List[AuditLogResponse]:
-    """Get audit logs (admin only)."""
-    query = select(AuditLog, User.username).outerjoin(User).order_by(AuditLog.created_at.desc())
+    """Get audit logs (admin only).
+
+    Keyset-paginated: pass the X-Next-Cursor header of a page back as
+    ``cursor`` to fetch the next (older) page.
+    """
+    query = (
+        select(AuditLog)
+        .options(selectinload(AuditLog.user))
+        .order_by(AuditLog.created_at.desc(), AuditLog.id.desc())
+    )
 
     if action:
         query = query.where(AuditLog.action == action)
+    if cursor:
+        # id breaks created_at ties, so rows logged in one transaction
+        # (same now()) are never skipped at a page boundary
+        query = query.where(
+            tuple_(AuditLog.created_at, AuditLog.id) < tuple_(*_decode_audit_cursor(cursor))
+        )
 
-    query = query.offset(offset).limit(limit)
+    query = query.limit(limit)
     result = await db.execute(query)
+    logs = result.scalars().all()
+
+    if len(logs) == limit:
+        response.headers["X-Next-Cursor"] = _encode_audit_cursor(logs[-1])
 
     return [
         AuditLogResponse(
             id=log.id,
             user_id=log.user_id,
-            username=username,
+            username=log.user.username if log.user else None,
             action=log.action,
             resource_type=log.resource_type,
             resource_id=log.resource_id,
@@ -409,7 +520,7 @@ async def get_audit_logs(
             ip_address=log.ip_address,
             created_at=log.created_at
         )
-        for log, username in result.all()
+        for log in logs
     ]
 
 
@@ -419,61 +530,66 @@ async def get_audit_logs(
 
 @router.get("/dashboard")
 async def get_dashboard(
-    current_user: Annotated[User, Depends(get_current_user)],
-    db: AsyncSession = Depends(get_db)
+    current_user: Annotated[User, Depends(get_current_user)]
 ) -> dict:
     """Get admin dashboard data."""
-    # Get mirror stats
-    mirrors_result = await db.execute(select(Mirror))
-    mirrors = mirrors_result.scalars().all()
-
-    # Get user count
-    user_count_result = await db.execute(select(func.count(User.id)))
-    user_count = user_count_result.scalar()
+    # Mirror and user totals in a single aggregate statement
+    stats_stmt = select(
+        func.count(Mirror.id).label("total"),
+        func.count(Mirror.id).filter(Mirror.status == MirrorStatus.ACTIVE).label("active"),
+        func.count(Mirror.id).filter(Mirror.status == MirrorStatus.SYNCING).label("syncing"),
+        func.count(Mirror.id).filter(Mirror.status == MirrorStatus.ERROR).label("error"),
+        # SUM(bigint) is numeric in Postgres; cast back so the JSON stays an int
+        cast(func.coalesce(func.sum(Mirror.total_size_bytes), 0), BigInteger).label("total_size_bytes"),
+        select(func.count()).select_from(User).scalar_subquery().label("user_count"),
+    )
 
-    # Get recent sync jobs
-    recent_syncs = await db.execute(
-        select(SyncJob)
+    # Recent sync jobs (columns only; rsync_output can be large)
+    syncs_stmt = (
+        select(SyncJob.id, SyncJob.mirror_id, SyncJob.status, SyncJob.created_at)
         .order_by(SyncJob.created_at.desc())
         .limit(5)
     )
 
-    # Get recent audit logs
-    recent_logs = await db.execute(
-        select(AuditLog)
+    # Recent audit logs
+    logs_stmt = (
+        select(AuditLog.id, AuditLog.action, AuditLog.created_at)
         .order_by(AuditLog.created_at.desc())
         .limit(10)
     )
 
-    total_size = sum(m.total_size_bytes or 0 for m in mirrors)
+    stats_result, recent_syncs, recent_logs = await execute_concurrently(
+        stats_stmt, syncs_stmt, logs_stmt
+    )
+    stats = stats_result.one()._mapping
 
     return {
         "mirrors": {
-            "total": len(mirrors),
-            "active": sum(1 for m in mirrors if m.status == MirrorStatus.ACTIVE),
-            "syncing": sum(1 for m in mirrors if m.status == MirrorStatus.SYNCING),
-            "error": sum(1 for m in mirrors if m.status == MirrorStatus.ERROR),
-            "total_size_bytes": total_size
+            "total": stats["total"],
+            "active": stats["active"],
+            "syncing": stats["syncing"],
+            "error": stats["error"],
+            "total_size_bytes": stats["total_size_bytes"]
         },
         "users": {
-            "total": user_count
+            "total": stats["user_count"]
         },
         "recent_syncs": [
             {
                 "id": job.id,
                 "mirror_id": job.mirror_id,
                 "status": job.status.value,
-                "created_at": job.created_at.isoformat()
+                "created_at": job.created_at
             }
-            for job in recent_syncs.scalars().all()
+            for job in recent_syncs.all()
         ],
         "recent_activity": [
             {
                 "id": log.id,
                 "action": log.action,
-                "created_at": log.created_at.isoformat()
+                "created_at": log.created_at
             }
-            for log in recent_logs.scalars().all()
+            for log in recent_logs.all()
         ]
     }
 
@@ -515,21 +631,29 @@ async def update_settings(
     request: Request,
     data: SettingsUpdateRequest,
     current_user: Annotated[User, Depends(require_admin)],
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    redis_client: aioredis.Redis = Depends(get_redis)
 ) -> dict:
     """Update settings (admin only)."""
     changes = {}
+    if not data.settings:
+        return {"message": "Settings updated", "changes": changes}
 
-    for key, value in data.settings.items():
-        result = await db.execute(select(Setting).where(Setting.key == key))
-        setting = result.scalar_one_or_none()
+    # Fetch every targeted setting in one query
+    result = await db.execute(
+        select(Setting).where(Setting.key.in_(list(data.settings)))
+    )
+    by_key = {s.key: s for s in result.scalars().all()}
 
-        if setting is None:
+    for key in data.settings:
+        if key not in by_key:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Setting '{key}' not found"
             )
 
+    for key, value in data.settings.items():
+        setting = by_key[key]
         old_value = setting.value
         setting.value = value
         setting.updated_at = datetime.now(timezone.utc)
@@ -537,8 +661,10 @@ async def update_settings(
 
     await db.commit()
 
-    await create_audit_log(
-        db=db,
+    # Published after commit so subscribers reload the new values
+    await redis_client.publish(SETTINGS_INVALIDATE_CHANNEL, ",".join(changes))
+
+    create_audit_log(
         user_id=current_user.id,
         action="settings_updated",
         resource_type="settings",
@@ -1,10 +1,12 @@
 """
 Authentication API endpoints.
 """
+import hashlib
+import json
 from datetime import datetime, timezone
 from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from pydantic import BaseModel
 import redis.asyncio as aioredis
@@ -12,19 +14,20 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 import structlog
 
+from app.core.audit import enqueue_audit_log
 from app.core.database import get_db
 from app.core.redis import get_redis
 from app.core.security import (
-    verify_password,
-    hash_password,
+    hash_password_async,
+    password_needs_rehash,
+    verify_password_async,
     create_access_token,
     decode_access_token,
     blacklist_token,
-    is_token_blacklisted,
-    TokenData
+    TokenData,
+    TOKEN_BLACKLIST_PREFIX
 )
 from app.models.user import User, UserRole
-from app.models.audit_log import AuditLog
 from app.core.config import settings
 
 logger = structlog.get_logger(__name__)
@@ -32,6 +35,28 @@ router = APIRouter()
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/token")
 
+ME_CACHE_MAX_AGE = 30  # seconds
+
+# Short-lived cache of the authenticated user, keyed by token hash
+USER_CACHE_PREFIX = "auth_user:"
+USER_CACHE_INDEX_PREFIX = "auth_user_keys:"
+USER_CACHE_TTL = 30  # seconds
+
+LOGIN_RATE_PREFIX = "login_attempts:"
+
+# Verified against when the username does not exist so failed logins
+# cost the same regardless of whether the account is real; hashed lazily
+# so importing the module doesn't pay for a bcrypt round
+_DUMMY_HASH: Optional[str] = None
+
+
+async def _get_dummy_hash() -> str:
+    """Return the timing-equalization hash, computing it on first use."""
+    global _DUMMY_HASH
+    if _DUMMY_HASH is None:
+        _DUMMY_HASH = await hash_password_async("x" * 16)
+    return _DUMMY_HASH
+
 
 # Pydantic models
 class Token(BaseModel):
@@ -59,6 +84,52 @@ class UserCreate(BaseModel):
     role: UserRole = UserRole.READONLY
 
 
+def _user_cache_key(token: str) -> str:
+    """Build the Redis key for a token's cached user."""
+    return USER_CACHE_PREFIX + hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def _user_from_cache(raw: str) -> User:
+    """Rehydrate a detached User from its cached representation."""
+    data = json.loads(raw)
+    return User(
+        id=data["id"],
+        username=data["username"],
+        email=data["email"],
+        role=UserRole(data["role"]),
+        is_active=data["is_active"],
+        created_at=datetime.fromisoformat(data["created_at"]),
+        last_login=datetime.fromisoformat(data["last_login"]) if data["last_login"] else None,
+    )
+
+
+async def cache_user(redis_client: aioredis.Redis, token: str, user: User, ttl: int) -> None:
+    """Cache a user for a token and index the key for invalidation."""
+    key = _user_cache_key(token)
+    index_key = f"{USER_CACHE_INDEX_PREFIX}{user.id}"
+    payload = json.dumps({
+        "id": user.id,
+        "username": user.username,
+        "email": user.email,
+        "role": user.role.value,
+        "is_active": user.is_active,
+        "created_at": user.created_at.isoformat(),
+        "last_login": user.last_login.isoformat() if user.last_login else None,
+    })
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.setex(key, ttl, payload)
+        pipe.sadd(index_key, key)
+        pipe.expire(index_key, USER_CACHE_TTL)
+        await pipe.execute()
+
+
+async def invalidate_user_cache(redis_client: aioredis.Redis, user_id: int) -> None:
+    """Drop all cached entries for a user after it has been modified."""
+    index_key = f"{USER_CACHE_INDEX_PREFIX}{user_id}"
+    keys = await redis_client.smembers(index_key)
+    await redis_client.delete(index_key, *keys)
+
+
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
     db: AsyncSession = Depends(get_db),
@@ -75,10 +146,18 @@ async def get_current_user(
     if token_data is None:
         raise credentials_exception
 
-    # Check if token has been revoked
-    if token_data.jti and await is_token_blacklisted(redis_client, token_data.jti):
+    # Revocation check and cached user lookup in a single round-trip
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.exists(f"{TOKEN_BLACKLIST_PREFIX}{token_data.jti}")
+        pipe.get(_user_cache_key(token))
+        revoked, cached = await pipe.execute()
+
+    if token_data.jti and revoked:
         raise credentials_exception
 
+    if cached is not None:
+        return _user_from_cache(cached)
+
     # Get user from database
     result = await db.execute(
         select(User).where(User.username == token_data.username)
@@ -88,6 +167,10 @@ async def get_current_user(
     if user is None or not user.is_active:
         raise credentials_exception
 
+    ttl = min(USER_CACHE_TTL, int((token_data.exp - datetime.now(timezone.utc)).total_seconds()))
+    if ttl > 0:
+        await cache_user(redis_client, token, user, ttl)
+
     return user
 
 
@@ -129,8 +212,7 @@ async def require_operator(
     return current_user
 
 
-async def create_audit_log(
-    db: AsyncSession,
+def create_audit_log(
     user_id: Optional[int],
     action: str,
     resource_type: str,
@@ -138,38 +220,59 @@ async def create_audit_log(
     details: Optional[dict] = None,
     request: Optional[Request] = None
 ) -> None:
-    """Create an audit log entry."""
-    audit_log = AuditLog(
-        user_id=user_id,
-        action=action,
-        resource_type=resource_type,
-        resource_id=resource_id,
-        details=details,
-        ip_address=request.client.host if request and request.client else None,
-        user_agent=request.headers.get("user-agent") if request else None
-    )
-    db.add(audit_log)
-    await db.commit()
+    """Queue an audit log entry for the background writer."""
+    enqueue_audit_log({
+        "user_id": user_id,
+        "action": action,
+        "resource_type": resource_type,
+        "resource_id": resource_id,
+        "details": details,
+        "ip_address": request.client.host if request and request.client else None,
+        "user_agent": request.headers.get("user-agent") if request else None,
+        "created_at": datetime.now(timezone.utc),
+    })
 
 
 @router.post("/token", response_model=Token)
 async def login(
     request: Request,
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    redis_client: aioredis.Redis = Depends(get_redis)
 ) -> Token:
     """Authenticate and get access token."""
+    # Throttle before any password hashing so probes can't burn CPU
+    client_ip = request.client.host if request.client else "unknown"
+    rate_key = f"{LOGIN_RATE_PREFIX}{client_ip}:{form_data.username}"
+    async with redis_client.pipeline(transaction=True) as pipe:
+        # SET NX starts the window only on the first attempt (EXPIRE NX
+        # would need Redis 7)
+        pipe.set(rate_key, 0, ex=settings.LOGIN_RATE_WINDOW, nx=True)
+        pipe.incr(rate_key)
+        _, attempts = await pipe.execute()
+    if attempts > settings.LOGIN_RATE_LIMIT:
+        logger.warning("Login rate limit exceeded", username=form_data.username, ip=client_ip)
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts, try again later"
+        )
+
     # Get user
     result = await db.execute(
         select(User).where(User.username == form_data.username)
     )
     user = result.scalar_one_or_none()
 
-    # Verify credentials
-    if user is None or not verify_password(form_data.password, user.password_hash):
+    # Verify credentials; always run one hash check for flat timing
+    if user is None:
+        await verify_password_async(form_data.password, await _get_dummy_hash())
+        password_ok = False
+    else:
+        password_ok = await verify_password_async(form_data.password, user.password_hash)
+
+    if not password_ok:
         logger.warning("Failed login attempt", username=form_data.username)
-        await create_audit_log(
-            db=db,
+        create_audit_log(
             user_id=None,
             action="login_failed",
             resource_type="auth",
@@ -188,10 +291,19 @@ async def login(
             detail="User account is disabled"
         )
 
+    # Upgrade hashes made with an outdated work factor while we have the plaintext
+    if password_needs_rehash(user.password_hash):
+        user.password_hash = await hash_password_async(form_data.password)
+
     # Update last login
     user.last_login = datetime.now(timezone.utc)
     await db.commit()
 
+    # Only failures count towards the limit; a good login resets it
+    await redis_client.delete(rate_key)
+    # Cached copies still carry the previous last_login
+    await invalidate_user_cache(redis_client, user.id)
+
     # Create token
     access_token = create_access_token(
         data={
@@ -202,8 +314,7 @@ async def login(
     )
 
     logger.info("User logged in", user_id=user.id, username=user.username)
-    await create_audit_log(
-        db=db,
+    create_audit_log(
         user_id=user.id,
         action="login_success",
         resource_type="auth",
@@ -215,9 +326,13 @@ async def login(
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
+    response: Response,
     current_user: Annotated[User, Depends(get_current_user)]
 ) -> User:
     """Get current user information."""
+    # Per-identity only: never shared caches, keyed on the bearer token
+    response.headers["Cache-Control"] = f"private, max-age={ME_CACHE_MAX_AGE}"
+    response.headers["Vary"] = "Authorization"
     return current_user
 
 
@@ -226,16 +341,15 @@ async def logout(
     request: Request,
     current_user: Annotated[User, Depends(get_current_user)],
     token_data: Annotated[TokenData, Depends(get_current_token_data)],
-    redis_client: aioredis.Redis = Depends(get_redis),
-    db: AsyncSession = Depends(get_db)
+    redis_client: aioredis.Redis = Depends(get_redis)
 ) -> dict:
     """Logout current user and invalidate the token."""
     # Blacklist the token in Redis so it can't be reused
     if token_data.jti:
         await blacklist_token(redis_client, token_data.jti, token_data.exp)
+    await invalidate_user_cache(redis_client, current_user.id)
 
-    await create_audit_log(
-        db=db,
+    create_audit_log(
         user_id=current_user.id,
         action="logout",
         resource_type="auth",
@@ -5,13 +5,22 @@ from datetime import datetime, timezone
 from typing import List, Optional
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import BigInteger, cast, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
-import humanize
-
-from app.core.database import get_db
+from sqlalchemy.orm import load_only
+import redis.asyncio as aioredis
+
+from app.core.database import get_db_ro
+from app.core.formatting import natural_size
+from app.core.http_cache import (
+    compute_mirrors_etag,
+    not_modified,
+    get_cached_response,
+    store_cached_response,
+)
+from app.core.redis import get_redis
 from app.core.config import settings
 from app.models.mirror import Mirror, MirrorType, MirrorStatus
 from app.models.sync_job import SyncJob, SyncStatus
@@ -59,78 +68,88 @@ class DirectoryListing(BaseModel):
     parent_path: Optional[str]
 
 
+# ORM attributes copied verbatim into the response models
+_MIRROR_FIELDS = (
+    "id",
+    "name",
+    "mirror_type",
+    "enabled",
+    "status",
+    "last_sync_completed",
+    "total_size_bytes",
+    "file_count",
+)
+_DETAIL_FIELDS = _MIRROR_FIELDS + (
+    "upstream_url",
+    "local_path",
+    "last_sync_started",
+    "last_sync_error",
+    "created_at",
+    "updated_at",
+)
+
+
+_URL_PATHS = {
+    MirrorType.FREEBSD: "/FreeBSD/",
+    MirrorType.NETBSD: "/NetBSD/",
+    MirrorType.OPENBSD: "/OpenBSD/"
+}
+
+
 def get_url_path(mirror_type: MirrorType) -> str:
     """Get the URL path for a mirror type."""
-    paths = {
-        MirrorType.FREEBSD: "/FreeBSD/",
-        MirrorType.NETBSD: "/NetBSD/",
-        MirrorType.OPENBSD: "/OpenBSD/"
-    }
-    return paths.get(mirror_type, "/")
+    return _URL_PATHS.get(mirror_type, "/")
 
 
 @router.get("/", response_model=List[MirrorResponse])
 async def list_mirrors(
-    db: AsyncSession = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db_ro)
 ) -> List[MirrorResponse]:
     """List all configured mirrors and their status."""
+    etag = await compute_mirrors_etag(db)
+    cached = not_modified(request, response, etag)
+    if cached is not None:
+        return cached
+
     result = await db.execute(
-        select(Mirror).where(Mirror.enabled == True).order_by(Mirror.name)
+        select(Mirror)
+        .options(load_only(*(getattr(Mirror, f) for f in _MIRROR_FIELDS)))
+        .where(Mirror.enabled == True)
+        .order_by(Mirror.name)
     )
     mirrors = result.scalars().all()
     
-    response = []
-    for mirror in mirrors:
-        response.append(MirrorResponse(
-            id=mirror.id,
-            name=mirror.name,
-            mirror_type=mirror.mirror_type,
-            enabled=mirror.enabled,
-            status=mirror.status,
-            last_sync_completed=mirror.last_sync_completed,
-            total_size_bytes=mirror.total_size_bytes,
-            total_size_human=humanize.naturalsize(mirror.total_size_bytes) if mirror.total_size_bytes else None,
-            file_count=mirror.file_count,
+    # Trusted ORM data: skip per-field validation
+    return [
+        MirrorResponse.model_construct(
+            **{f: getattr(mirror, f) for f in _MIRROR_FIELDS},
+            total_size_human=natural_size(mirror.total_size_bytes) if mirror.total_size_bytes else None,
             url_path=get_url_path(mirror.mirror_type)
-        ))
-    
-    return response
+        )
+        for mirror in mirrors
+    ]
 
 
 @router.get("/{mirror_id}", response_model=MirrorDetailResponse)
 async def get_mirror(
     mirror_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_ro)
 ) -> MirrorDetailResponse:
     """Get detailed information about a specific mirror."""
-    result = await db.execute(
-        select(Mirror).where(Mirror.id == mirror_id)
-    )
-    mirror = result.scalar_one_or_none()
+    mirror = await db.get(Mirror, mirror_id)
     
-    if not mirror:
+    if mirror is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Mirror not found"
         )
     
-    return MirrorDetailResponse(
-        id=mirror.id,
-        name=mirror.name,
-        mirror_type=mirror.mirror_type,
-        enabled=mirror.enabled,
-        status=mirror.status,
-        upstream_url=mirror.upstream_url,
-        local_path=mirror.local_path,
-        last_sync_started=mirror.last_sync_started,
-        last_sync_completed=mirror.last_sync_completed,
-        last_sync_error=mirror.last_sync_error,
-        total_size_bytes=mirror.total_size_bytes,
-        total_size_human=humanize.naturalsize(mirror.total_size_bytes) if mirror.total_size_bytes else None,
-        file_count=mirror.file_count,
-        url_path=get_url_path(mirror.mirror_type),
-        created_at=mirror.created_at,
-        updated_at=mirror.updated_at
+    return MirrorDetailResponse.model_construct(
+        **{f: getattr(mirror, f) for f in _DETAIL_FIELDS},
+        total_size_human=natural_size(mirror.total_size_bytes) if mirror.total_size_bytes else None,
+        url_path=get_url_path(mirror.mirror_type)
     )
 
 
@@ -138,58 +157,87 @@ async def get_mirror(
 async def get_sync_history(
     mirror_id: int,
     limit: int = 10,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_ro)
 ) -> List[dict]:
     """Get sync job history for a mirror."""
+    # Column select: plain row mappings, no ORM hydration
     result = await db.execute(
-        select(SyncJob)
+        select(
+            SyncJob.id,
+            SyncJob.status,
+            SyncJob.started_at,
+            SyncJob.completed_at,
+            SyncJob.files_transferred,
+            SyncJob.bytes_transferred,
+            SyncJob.triggered_by,
+            SyncJob.error_message,
+            SyncJob.created_at,
+        )
         .where(SyncJob.mirror_id == mirror_id)
         .order_by(SyncJob.created_at.desc())
         .limit(limit)
     )
-    jobs = result.scalars().all()
     
     return [
         {
-            "id": job.id,
-            "status": job.status,
-            "started_at": job.started_at,
-            "completed_at": job.completed_at,
-            "files_transferred": job.files_transferred,
-            "bytes_transferred": job.bytes_transferred,
-            "bytes_transferred_human": humanize.naturalsize(job.bytes_transferred) if job.bytes_transferred else None,
-            "triggered_by": job.triggered_by,
-            "error_message": job.error_message,
-            "created_at": job.created_at
+            **job,
+            "bytes_transferred_human": natural_size(job["bytes_transferred"]) if job["bytes_transferred"] else None,
         }
-        for job in jobs
+        for job in result.mappings()
     ]
 
 
 @router.get("/status/summary")
 async def get_mirrors_summary(
-    db: AsyncSession = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db_ro),
+    redis_client: aioredis.Redis = Depends(get_redis)
 ) -> dict:
     """Get summary status of all mirrors."""
-    result = await db.execute(select(Mirror))
-    mirrors = result.scalars().all()
-    
-    total_size = sum(m.total_size_bytes or 0 for m in mirrors)
-    total_files = sum(m.file_count or 0 for m in mirrors)
+    etag = await compute_mirrors_etag(db)
+    cached = not_modified(request, response, etag)
+    if cached is None:
+        cached = await get_cached_response(redis_client, "mirrors:summary", etag, response)
+    if cached is not None:
+        return cached
+
+    # Per-mirror columns plus totals as window aggregates: one round-trip,
+    # no ORM hydration
+    result = await db.execute(
+        select(
+            Mirror.name,
+            Mirror.status,
+            Mirror.enabled,
+            Mirror.last_sync_completed,
+            Mirror.total_size_bytes,
+            func.count().over().label("total_mirrors"),
+            func.count().filter(Mirror.enabled == True).over().label("enabled_mirrors"),
+            # SUM(bigint) is numeric in Postgres; cast back so the JSON stays an int
+            cast(func.coalesce(func.sum(Mirror.total_size_bytes).over(), 0), BigInteger).label("total_size"),
+            cast(func.coalesce(func.sum(Mirror.file_count).over(), 0), BigInteger).label("total_files"),
+        )
+    )
+    rows = result.all()
+
+    first = rows[0] if rows else None
+    total_size = first.total_size if first else 0
+    total_files = first.total_files if first else 0
     
-    return {
-        "total_mirrors": len(mirrors),
-        "enabled_mirrors": sum(1 for m in mirrors if m.enabled),
+    payload = {
+        "total_mirrors": first.total_mirrors if first else 0,
+        "enabled_mirrors": first.enabled_mirrors if first else 0,
         "total_size_bytes": total_size,
-        "total_size_human": humanize.naturalsize(total_size),
+        "total_size_human": natural_size(total_size),
         "total_files": total_files,
         "mirrors": {
             m.name: {
                 "status": m.status.value,
                 "enabled": m.enabled,
-                "last_sync": m.last_sync_completed.isoformat() if m.last_sync_completed else None,
-                "size_human": humanize.naturalsize(m.total_size_bytes) if m.total_size_bytes else None
+                "last_sync": m.last_sync_completed,
+                "size_human": natural_size(m.total_size_bytes) if m.total_size_bytes else None
             }
-            for m in mirrors
+            for m in rows
         }
     }
+    return await store_cached_response(redis_client, "mirrors:summary", etag, payload, response)
@@ -1,16 +1,25 @@
 """
 Statistics API endpoints.
 """
+from collections import Counter
 from datetime import datetime, timezone, timedelta
 from typing import Optional
 
-from fastapi import APIRouter, Depends
-from sqlalchemy import select, func
+from fastapi import APIRouter, Depends, Request, Response
+from sqlalchemy import BigInteger, cast, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
-import humanize
+import redis.asyncio as aioredis
 
-from app.core.database import get_db
-from app.models.mirror import Mirror
+from app.core.database import get_db_ro, execute_concurrently
+from app.core.formatting import natural_size, int_comma
+from app.core.http_cache import (
+    compute_mirrors_etag,
+    not_modified,
+    get_cached_response,
+    store_cached_response,
+)
+from app.core.redis import get_redis
+from app.models.mirror import Mirror, MirrorStatus
 from app.models.sync_job import SyncJob, SyncStatus
 
 router = APIRouter()
@@ -18,112 +27,168 @@ router = APIRouter()
 
 @router.get("/overview")
 async def get_stats_overview(
-    db: AsyncSession = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db_ro),
+    redis_client: aioredis.Redis = Depends(get_redis)
 ) -> dict:
     """Get public statistics overview."""
-    # Get mirrors
-    result = await db.execute(select(Mirror).where(Mirror.enabled == True))
-    mirrors = result.scalars().all()
+    etag = await compute_mirrors_etag(db)
+    cached = not_modified(request, response, etag)
+    if cached is None:
+        cached = await get_cached_response(redis_client, "stats:overview", etag, response)
+    if cached is not None:
+        return cached
+
+    # Per-mirror columns plus totals as window aggregates in one query
+    result = await db.execute(
+        select(
+            Mirror.name,
+            Mirror.status,
+            Mirror.last_sync_completed,
+            Mirror.total_size_bytes,
+            Mirror.file_count,
+            # SUM(bigint) is numeric in Postgres; cast back so the JSON stays an int
+            cast(func.coalesce(func.sum(Mirror.total_size_bytes).over(), 0), BigInteger).label("total_size"),
+            cast(func.coalesce(func.sum(Mirror.file_count).over(), 0), BigInteger).label("total_files"),
+        ).where(Mirror.enabled == True)
+    )
+    mirrors = result.all()
     
-    total_size = sum(m.total_size_bytes or 0 for m in mirrors)
-    total_files = sum(m.file_count or 0 for m in mirrors)
+    total_size = mirrors[0].total_size if mirrors else 0
+    total_files = mirrors[0].total_files if mirrors else 0
     
-    return {
+    payload = {
         "mirrors": {
             name: {
                 "status": m.status.value,
-                "last_updated": m.last_sync_completed.isoformat() if m.last_sync_completed else None,
-                "size": humanize.naturalsize(m.total_size_bytes) if m.total_size_bytes else "Unknown",
-                "files": humanize.intcomma(m.file_count) if m.file_count else "Unknown"
+                "last_updated": m.last_sync_completed,
+                "size": natural_size(m.total_size_bytes) if m.total_size_bytes else "Unknown",
+                "files": int_comma(m.file_count) if m.file_count else "Unknown"
             }
             for m in mirrors
             for name in [m.name]
         },
         "totals": {
-            "size": humanize.naturalsize(total_size),
+            "size": natural_size(total_size),
             "size_bytes": total_size,
-            "files": humanize.intcomma(total_files),
+            "files": int_comma(total_files),
             "files_count": total_files
         },
-        "generated_at": datetime.now(timezone.utc).isoformat()
+        "generated_at": datetime.now(timezone.utc)
     }
+    return await store_cached_response(redis_client, "stats:overview", etag, payload, response)
 
 
 @router.get("/sync-activity")
 async def get_sync_activity(
-    days: int = 7,
-    db: AsyncSession = Depends(get_db)
+    days: int = 7
 ) -> dict:
     """Get sync activity for the last N days."""
     cutoff = datetime.now(timezone.utc) - timedelta(days=days)
     
-    result = await db.execute(
-        select(SyncJob)
+    # Per-status counts and transfer totals, aggregated in Postgres
+    agg_stmt = (
+        select(
+            SyncJob.status,
+            func.count().label("count"),
+            func.coalesce(func.sum(SyncJob.bytes_transferred), 0).label("bytes"),
+            func.coalesce(func.sum(SyncJob.files_transferred), 0).label("files"),
+        )
+        .where(SyncJob.created_at >= cutoff)
+        .group_by(SyncJob.status)
+    )
+    # Only the handful of rows actually listed
+    recent_stmt = (
+        select(
+            SyncJob.id,
+            SyncJob.mirror_id,
+            SyncJob.status,
+            SyncJob.started_at,
+            SyncJob.completed_at,
+            SyncJob.bytes_transferred,
+        )
         .where(SyncJob.created_at >= cutoff)
         .order_by(SyncJob.created_at.desc())
+        .limit(10)
     )
-    jobs = result.scalars().all()
-    
-    # Aggregate by status
+    agg_result, recent_result = await execute_concurrently(agg_stmt, recent_stmt)
+
     by_status = {}
-    for job in jobs:
-        status = job.status.value
-        by_status[status] = by_status.get(status, 0) + 1
-    
-    # Calculate totals
-    total_bytes = sum(j.bytes_transferred or 0 for j in jobs if j.status == SyncStatus.COMPLETED)
-    total_files = sum(j.files_transferred or 0 for j in jobs if j.status == SyncStatus.COMPLETED)
+    total_syncs = 0
+    total_bytes = 0
+    total_files = 0
+    for row in agg_result.all():
+        by_status[row.status.value] = row.count
+        total_syncs += row.count
+        if row.status == SyncStatus.COMPLETED:
+            total_bytes = row.bytes
+            total_files = row.files
+
+    jobs = recent_result.all()
     
     return {
         "period_days": days,
-        "total_syncs": len(jobs),
+        "total_syncs": total_syncs,
         "by_status": by_status,
-        "data_transferred": humanize.naturalsize(total_bytes),
-        "files_transferred": humanize.intcomma(total_files),
+        "data_transferred": natural_size(total_bytes),
+        "files_transferred": int_comma(total_files),
         "recent_syncs": [
             {
                 "id": job.id,
                 "mirror_id": job.mirror_id,
                 "status": job.status.value,
-                "started_at": job.started_at.isoformat() if job.started_at else None,
-                "completed_at": job.completed_at.isoformat() if job.completed_at else None,
-                "bytes_transferred": humanize.naturalsize(job.bytes_transferred) if job.bytes_transferred else None
+                "started_at": job.started_at,
+                "completed_at": job.completed_at,
+                "bytes_transferred": natural_size(job.bytes_transferred) if job.bytes_transferred else None
             }
-            for job in jobs[:10]
+            for job in jobs
         ]
     }
 
 
 @router.get("/health")
 async def get_system_health(
-    db: AsyncSession = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db_ro),
+    redis_client: aioredis.Redis = Depends(get_redis)
 ) -> dict:
     """Get system health status for public display."""
-    result = await db.execute(select(Mirror).where(Mirror.enabled == True))
-    mirrors = result.scalars().all()
-    
-    # Check overall health
-    all_healthy = all(m.status.value in ["active", "syncing"] for m in mirrors)
-    any_syncing = any(m.status.value == "syncing" for m in mirrors)
-    any_error = any(m.status.value == "error" for m in mirrors)
+    etag = await compute_mirrors_etag(db)
+    cached = not_modified(request, response, etag)
+    if cached is None:
+        cached = await get_cached_response(redis_client, "stats:health", etag, response)
+    if cached is not None:
+        return cached
+
+    result = await db.execute(
+        select(Mirror.name, Mirror.status, Mirror.last_sync_completed)
+        .where(Mirror.enabled == True)
+    )
+    mirrors = result.all()
     
-    if any_error:
+    # Check overall health in a single pass
+    counts = Counter(m.status for m in mirrors)
+
+    if counts[MirrorStatus.ERROR]:
         overall_status = "degraded"
-    elif any_syncing:
+    elif counts[MirrorStatus.SYNCING]:
         overall_status = "updating"
-    elif all_healthy:
+    elif counts[MirrorStatus.ACTIVE] == len(mirrors):
         overall_status = "healthy"
     else:
         overall_status = "unknown"
     
-    return {
+    payload = {
         "status": overall_status,
         "mirrors": {
             m.name: {
                 "status": m.status.value,
-                "last_sync": m.last_sync_completed.isoformat() if m.last_sync_completed else None
+                "last_sync": m.last_sync_completed
             }
             for m in mirrors
         },
-        "checked_at": datetime.now(timezone.utc).isoformat()
+        "checked_at": datetime.now(timezone.utc)
     }
+    return await store_cached_response(redis_client, "stats:health", etag, payload, response)
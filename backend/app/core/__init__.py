@@ -1,10 +1,12 @@
 """Core module exports."""
 from app.core.config import settings
-from app.core.database import get_db, Base
+from app.core.database import get_db, get_db_ro, Base
 from app.core.redis import get_redis
 from app.core.security import (
     verify_password,
     hash_password,
+    verify_password_async,
+    hash_password_async,
     create_access_token,
     decode_access_token,
     TokenData
@@ -13,10 +15,13 @@ from app.core.security import (
 __all__ = [
     "settings",
     "get_db",
+    "get_db_ro",
     "Base",
     "get_redis",
     "verify_password",
     "hash_password",
+    "verify_password_async",
+    "hash_password_async",
     "create_access_token",
     "decode_access_token",
     "TokenData",
@@ -0,0 +1,94 @@
+"""
+Audit log write queue.
+
+Endpoints enqueue audit entries; a background writer drains the queue and
+persists them in batched multi-row INSERTs on its own session.
+"""
+import asyncio
+from typing import Optional
+
+from sqlalchemy import insert
+import structlog
+
+from app.core.config import settings
+from app.core.database import async_session_maker
+
+logger = structlog.get_logger(__name__)
+
+AUDIT_QUEUE_MAXSIZE = 10000
+
+# Global queue and writer task
+audit_queue: Optional[asyncio.Queue] = None
+writer_task: Optional[asyncio.Task] = None
+
+
+def enqueue_audit_log(entry: dict) -> None:
+    """Queue an audit log row for the background writer."""
+    if audit_queue is None:
+        logger.error("Audit writer not initialized, dropping entry", action=entry.get("action"))
+        return
+    try:
+        audit_queue.put_nowait(entry)
+    except asyncio.QueueFull:
+        logger.error("Audit queue full, dropping entry", action=entry.get("action"))
+
+
+async def _next_batch(queue: asyncio.Queue) -> list:
+    """Wait for one entry, then collect more until the batch is full or the window closes."""
+    loop = asyncio.get_running_loop()
+    batch = [await queue.get()]
+    deadline = loop.time() + settings.AUDIT_FLUSH_INTERVAL
+    while len(batch) < settings.AUDIT_BATCH_SIZE and batch[-1] is not None:
+        timeout = deadline - loop.time()
+        if timeout <= 0:
+            break
+        try:
+            batch.append(await asyncio.wait_for(queue.get(), timeout))
+        except asyncio.TimeoutError:
+            break
+    return batch
+
+
+async def _write_batch(batch: list) -> None:
+    """Persist a batch of audit rows in a single statement."""
+    # Imported here to avoid a circular import through app.models
+    from app.models.audit_log import AuditLog
+
+    try:
+        async with async_session_maker() as session:
+            await session.execute(insert(AuditLog), batch)
+            await session.commit()
+    except Exception as e:
+        logger.error("Failed to write audit log batch", count=len(batch), error=str(e))
+
+
+async def _writer(queue: asyncio.Queue) -> None:
+    """Drain the queue until the shutdown sentinel (None) is received."""
+    while True:
+        batch = await _next_batch(queue)
+        stop = batch[-1] is None
+        if stop:
+            batch.pop()
+        if batch:
+            await _write_batch(batch)
+        if stop:
+            return
+
+
+async def init_audit_writer() -> None:
+    """Start the background audit log writer."""
+    global audit_queue, writer_task
+    audit_queue = asyncio.Queue(maxsize=AUDIT_QUEUE_MAXSIZE)
+    writer_task = asyncio.create_task(_writer(audit_queue))
+    logger.info("Audit log writer started")
+
+
+async def close_audit_writer() -> None:
+    """Flush pending audit entries and stop the writer."""
+    global audit_queue, writer_task
+    if audit_queue is not None and writer_task is not None:
+        await audit_queue.put(None)
+        await writer_task
+    audit_queue = None
+    writer_task = None
+    logger.info("Audit log writer stopped")
@@ -4,7 +4,7 @@ Configuration settings for BSD Mirrors API.
 Uses pydantic-settings for environment variable management.
 """
 from functools import lru_cache
-from typing import List
+from typing import Any, List
 
 from pydantic import Field, PostgresDsn, RedisDsn
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -32,25 +32,24 @@ class Settings(BaseSettings):
     POSTGRES_USER: str = Field(default="bsdmirrors")
     POSTGRES_PASSWORD: str = Field(...)
     
-    @property
-    def DATABASE_URL(self) -> str:
-        """Construct async PostgreSQL connection URL."""
-        return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+    # Async PostgreSQL connection URL, assembled in model_post_init
+    DATABASE_URL: str = ""
     
     # Redis
     REDIS_HOST: str = Field(default="redis")
     REDIS_PORT: int = Field(default=6379)
     REDIS_PASSWORD: str = Field(...)
+    REDIS_MAX_CONNECTIONS: int = Field(default=50)
+    REDIS_POOL_TIMEOUT: int = Field(default=5)  # seconds to wait for a free connection
     
-    @property
-    def REDIS_URL(self) -> str:
-        """Construct Redis connection URL."""
-        return f"redis://:{self.REDIS_PASSWORD}@{self.REDIS_HOST}:{self.REDIS_PORT}/0"
+    # Redis connection URL, assembled in model_post_init
+    REDIS_URL: str = ""
     
     # Security
     SECRET_KEY: str = Field(...)
     JWT_ALGORITHM: str = Field(default="HS256")
     JWT_EXPIRY_HOURS: int = Field(default=8)
+    BCRYPT_ROUNDS: int = Field(default=12, ge=4, le=31)
     
     # Admin user (created on first run)
     ADMIN_USERNAME: str = Field(default="admin")
@@ -65,10 +64,24 @@ class Settings(BaseSettings):
     # Database pool
     DB_POOL_SIZE: int = Field(default=10)
     DB_MAX_OVERFLOW: int = Field(default=20)
+    DB_POOL_RECYCLE: int = Field(default=1800)  # seconds
+    DB_POOL_USE_LIFO: bool = Field(default=True)
+    DB_STATEMENT_CACHE_SIZE: int = Field(default=1024)
 
     # Rate limiting
     API_RATE_LIMIT: int = Field(default=10)
     API_RATE_BURST: int = Field(default=20)
+    LOGIN_RATE_LIMIT: int = Field(default=10)  # attempts per window per (ip, username)
+    LOGIN_RATE_WINDOW: int = Field(default=60)  # seconds
+    
+    # Audit log writer: rows per INSERT and how long to wait to fill a batch
+    AUDIT_BATCH_SIZE: int = Field(default=500, ge=1)
+    AUDIT_FLUSH_INTERVAL: float = Field(default=0.25, gt=0)  # seconds
+
+    def model_post_init(self, __context: Any) -> None:
+        """Construct connection URLs once per process."""
+        self.DATABASE_URL = f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+        self.REDIS_URL = f"redis://:{self.REDIS_PASSWORD}@{self.REDIS_HOST}:{self.REDIS_PORT}/0"
 
 
 @lru_cache
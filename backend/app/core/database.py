@@ -1,10 +1,14 @@
 """
 Database connection and session management.
 """
-from typing import AsyncGenerator
+import asyncio
+from typing import AsyncGenerator, List
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import CheckConstraint, Executable, Result, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.schema import AddConstraint
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 import structlog
 
 from app.core.config import settings
@@ -15,9 +19,19 @@ logger = structlog.get_logger(__name__)
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
+    poolclass=AsyncAdaptedQueuePool,
     pool_size=settings.DB_POOL_SIZE,
     max_overflow=settings.DB_MAX_OVERFLOW,
     pool_pre_ping=True,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    # LIFO keeps hot connections (and their prepared statements) in use
+    pool_use_lifo=settings.DB_POOL_USE_LIFO,
+    connect_args={
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        # Short OLTP queries never benefit from JIT compilation
+        "server_settings": {"jit": "off"},
+    },
 )
 
 # Session factory
@@ -29,6 +43,29 @@ async_session_maker = async_sessionmaker(
     autoflush=False,
 )
 
+# Read-only session factory: AUTOCOMMIT shares the pool but skips the
+# implicit BEGIN and the COMMIT/ROLLBACK round-trip at the end
+readonly_session_maker = async_sessionmaker(
+    engine.execution_options(isolation_level="AUTOCOMMIT"),
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
+
+# Indexes older schemas created that the models no longer declare
+OBSOLETE_INDEXES = (
+    # Superseded by ix_audit_logs_created_id_action / ix_audit_logs_user_created
+    "ix_audit_logs_action",
+    "ix_audit_logs_created_at",
+    "ix_audit_logs_created_brin",
+    "ix_audit_logs_created_desc_action",
+    "ix_audit_logs_user_id",
+    # Superseded by the covering ix_sync_jobs_mirror_created_covering
+    "ix_sync_jobs_mirror_created",
+    "ix_sync_jobs_mirror_id",
+)
+
 
 class Base(DeclarativeBase):
     """Base class for SQLAlchemy models."""
@@ -41,9 +78,81 @@ async def init_db() -> None:
         # Import models to register them
         from app.models import user, mirror, sync_job, audit_log, setting
         await conn.run_sync(Base.metadata.create_all)
+        await _convert_mirror_enum_columns(conn)
+    await _sync_indexes()
+    await warm_db_pool()
     logger.info("Database initialized")
 
 
+async def _convert_mirror_enum_columns(conn: AsyncConnection) -> None:
+    """Move mirrors columns created as native ENUM types to VARCHAR + CHECK.
+
+    create_all never alters existing tables, so databases created before the
+    switch are converted here. A no-op once the columns are VARCHAR.
+    """
+    from app.models.mirror import Mirror
+
+    # Serialize concurrent workers starting up against the same database
+    await conn.execute(text("SELECT pg_advisory_xact_lock(hashtext('mirrors_enum_columns'))"))
+    result = await conn.execute(text(
+        "SELECT column_name, udt_name FROM information_schema.columns "
+        "WHERE table_schema = current_schema() AND table_name = 'mirrors' "
+        "AND data_type = 'USER-DEFINED'"
+    ))
+    for column_name, udt_name in result.all():
+        column = Mirror.__table__.c[column_name]
+        await conn.execute(text(
+            f"ALTER TABLE mirrors ALTER COLUMN {column_name} "
+            f"TYPE varchar({column.type.length}) USING {column_name}::text"
+        ))
+        for constraint in Mirror.__table__.constraints:
+            if isinstance(constraint, CheckConstraint) and constraint.name == column.type.name:
+                await conn.execute(AddConstraint(constraint))
+        await conn.execute(text(f"DROP TYPE IF EXISTS {udt_name}"))
+        logger.info("Converted enum column to varchar", table="mirrors", column=column_name)
+
+
+async def _sync_indexes() -> None:
+    """Build declared indexes missing from existing tables, then drop obsolete ones.
+
+    create_all only indexes the tables it creates. Everything here runs
+    CONCURRENTLY outside a transaction so live tables keep taking writes; a
+    session advisory lock keeps concurrent workers from building twice.
+    """
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("SELECT pg_advisory_lock(hashtext('schema_indexes'))"))
+        try:
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    # NULL: missing; false: left INVALID by an interrupted build
+                    valid = await conn.scalar(
+                        text("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(CAST(:name AS text))"),
+                        {"name": index.name}
+                    )
+                    if valid:
+                        continue
+                    if valid is not None:
+                        await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {index.name}"))
+                    index.dialect_options["postgresql"]["concurrently"] = True
+                    try:
+                        await conn.run_sync(index.create)
+                    finally:
+                        index.dialect_options["postgresql"]["concurrently"] = False
+                    logger.info("Created index", index=index.name)
+
+            for index_name in OBSOLETE_INDEXES:
+                await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}"))
+        finally:
+            await conn.execute(text("SELECT pg_advisory_unlock(hashtext('schema_indexes'))"))
+
+
+async def warm_db_pool() -> None:
+    """Open pool_size connections up front so early requests skip connection setup."""
+    conns = await asyncio.gather(*(engine.connect() for _ in range(settings.DB_POOL_SIZE)))
+    await asyncio.gather(*(conn.close() for conn in conns))
+
+
 async def close_db() -> None:
     """Close database connection."""
     await engine.dispose()
@@ -61,3 +170,23 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             raise
         finally:
             await session.close()
+
+
+async def get_db_ro() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for a read-only database session (no transaction, no commit)."""
+    async with readonly_session_maker() as session:
+        yield session
+
+
+async def execute_concurrently(*statements: Executable) -> List[Result]:
+    """Run independent read statements in parallel, each on its own pooled session.
+
+    A single AsyncSession owns one connection and cannot run statements
+    concurrently, so each statement checks out its own. Async results are
+    buffered, so rows stay readable after the session closes.
+    """
+    async def _run(statement: Executable) -> Result:
+        async with readonly_session_maker() as session:
+            return await session.execute(statement)
+
+    return list(await asyncio.gather(*(_run(stmt) for stmt in statements)))
@@ -0,0 +1,21 @@
+"""
+Cached human-readable formatting for byte and file counts.
+
+Sizes only change when a sync completes, so the same values recur across
+requests and are memoized.
+"""
+from functools import lru_cache
+
+import humanize
+
+
+@lru_cache(maxsize=1024)
+def natural_size(value: int) -> str:
+    """Format a byte count, e.g. 1.2 GB."""
+    return humanize.naturalsize(value)
+
+
+@lru_cache(maxsize=1024)
+def int_comma(value: int) -> str:
+    """Format an integer with thousands separators."""
+    return humanize.intcomma(value)
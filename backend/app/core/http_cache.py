@@ -0,0 +1,79 @@
+"""
+HTTP conditional-request and Redis response caching helpers for
+mirror-derived responses.
+"""
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+import orjson
+import redis.asyncio as aioredis
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.mirror import Mirror
+
+MIRRORS_CACHE_MAX_AGE = 30  # seconds
+RESPONSE_CACHE_TTL = 30  # seconds
+RESPONSE_CACHE_PREFIX = "response_cache:"
+
+
+async def compute_mirrors_etag(db: AsyncSession) -> str:
+    """Build an ETag from the enabled mirrors' latest update time and count."""
+    result = await db.execute(
+        select(func.max(Mirror.updated_at), func.count())
+        .select_from(Mirror)
+        .where(Mirror.enabled == True)
+    )
+    max_updated_at, count = result.one()
+    digest = hashlib.blake2b(f"{max_updated_at}:{count}".encode(), digest_size=8).hexdigest()
+    return f'"{digest}"'
+
+
+def not_modified(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """Set caching headers; return a 304 response if the client copy is current."""
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={MIRRORS_CACHE_MAX_AGE}",
+    }
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in candidates or "*" in candidates:
+            return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
+async def get_cached_response(
+    redis_client: aioredis.Redis,
+    name: str,
+    etag: str,
+    response: Response
+) -> Optional[Response]:
+    """Return the cached JSON body for this ETag, if present.
+
+    Keys embed the ETag, so a mirror change moves readers to a new key and
+    stale entries simply expire.
+    """
+    raw = await redis_client.get(f"{RESPONSE_CACHE_PREFIX}{name}:{etag}")
+    if raw is None:
+        return None
+    return Response(content=raw, media_type="application/json", headers=dict(response.headers))
+
+
+async def store_cached_response(
+    redis_client: aioredis.Redis,
+    name: str,
+    etag: str,
+    payload: Any,
+    response: Response
+) -> Response:
+    """Serialize a payload once, cache it under its ETag and return it.
+
+    The bytes sent on a miss are exactly the bytes later served on a hit.
+    """
+    body = orjson.dumps(jsonable_encoder(payload))
+    await redis_client.setex(f"{RESPONSE_CACHE_PREFIX}{name}:{etag}", RESPONSE_CACHE_TTL, body)
+    return Response(content=body, media_type="application/json", headers=dict(response.headers))
@@ -0,0 +1,35 @@
+"""
+Queue-based log output.
+
+Log records are handed to a queue on the calling thread; a listener thread
+does the stream write, so logging never blocks the event loop on I/O.
+"""
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+from app.core.config import settings
+
+# Global listener thread
+listener: Optional[QueueListener] = None
+
+
+def init_logging() -> None:
+    """Route root logger output through a background queue listener."""
+    global listener
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.handlers = [QueueHandler(log_queue)]
+    root.setLevel(settings.LOG_LEVEL.upper())
+    listener = QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    listener.start()
+
+
+def close_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+    global listener
+    if listener is not None:
+        listener.stop()
+        listener = None
@@ -10,18 +10,27 @@ from app.core.config import settings
 
 logger = structlog.get_logger(__name__)
 
-# Global Redis client
+# Pub/sub channel announcing changed setting keys to the sync service
+SETTINGS_INVALIDATE_CHANNEL = "settings:invalidate"
+
+# Global connection pool and the Redis client sharing it
+redis_pool: Optional[redis.BlockingConnectionPool] = None
 redis_client: Optional[redis.Redis] = None
 
 
 async def init_redis() -> None:
     """Initialize Redis connection."""
-    global redis_client
-    redis_client = redis.from_url(
+    global redis_pool, redis_client
+    # Blocking pool: callers wait for a free connection instead of erroring
+    # when the cap is reached
+    redis_pool = redis.BlockingConnectionPool.from_url(
         settings.REDIS_URL,
+        max_connections=settings.REDIS_MAX_CONNECTIONS,
+        timeout=settings.REDIS_POOL_TIMEOUT,
         encoding="utf-8",
         decode_responses=True,
     )
+    redis_client = redis.Redis(connection_pool=redis_pool)
     # Test connection
     await redis_client.ping()
     logger.info("Redis connection established")
@@ -29,10 +38,13 @@ async def init_redis() -> None:
 
 async def close_redis() -> None:
     """Close Redis connection."""
-    global redis_client
+    global redis_pool, redis_client
     if redis_client:
         await redis_client.close()
         redis_client = None
+    if redis_pool:
+        await redis_pool.disconnect()
+        redis_pool = None
     logger.info("Redis connection closed")
 
 
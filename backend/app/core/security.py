@@ -1,12 +1,17 @@
 """
 Security utilities for authentication and authorization.
 """
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional
 from uuid import uuid4
 
 import bcrypt
-from jose import JWTError, jwt
+import jwt
 from pydantic import BaseModel
 import structlog
 
@@ -17,6 +22,13 @@ logger = structlog.get_logger(__name__)
 # Token blacklist key prefix for Redis
 TOKEN_BLACKLIST_PREFIX = "token_blacklist:"
 
+# Seconds a decoded token is reused before its signature is re-verified
+DECODE_CACHE_WINDOW = 60
+
+# bcrypt releases the GIL, so a thread pool spreads hashing across cores
+# while keeping it off the event loop
+_HASH_POOL = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="pwhash")
+
 
 class TokenData(BaseModel):
     """JWT token payload data."""
@@ -37,10 +49,32 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt."""
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a bcrypt hash was made with a different work factor."""
+    # bcrypt hashes look like $2b$12$<salt+hash>
+    try:
+        rounds = int(hashed_password.split("$")[2])
+    except (IndexError, ValueError):
+        return True
+    return rounds != settings.BCRYPT_ROUNDS
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_HASH_POOL, verify_password, plain_password, hashed_password)
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_HASH_POOL, hash_password, password)
+
+
 def create_access_token(
     data: dict,
     expires_delta: Optional[timedelta] = None
@@ -68,6 +102,17 @@ def create_access_token(
 
 def decode_access_token(token: str) -> Optional[TokenData]:
     """Decode and validate a JWT access token."""
+    now = time.time()
+    token_data = _decode_access_token_cached(token, int(now // DECODE_CACHE_WINDOW))
+    # Cached entries can outlive the token by up to one window
+    if token_data is None or token_data.exp.timestamp() <= now:
+        return None
+    return token_data
+
+
+@lru_cache(maxsize=4096)
+def _decode_access_token_cached(token: str, window: int) -> Optional[TokenData]:
+    """Verify and parse a token; ``window`` makes entries expire each DECODE_CACHE_WINDOW."""
     try:
         payload = jwt.decode(
             token,
@@ -90,7 +135,7 @@ def decode_access_token(token: str) -> Optional[TokenData]:
             exp=exp,
             jti=jti
         )
-    except JWTError as e:
+    except jwt.PyJWTError as e:
         logger.warning("JWT decode error", error=str(e))
         return None
 
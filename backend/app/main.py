@@ -9,20 +9,30 @@ from typing import AsyncGenerator
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
+import orjson
 import structlog
 
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
 
 from app.core.config import settings
 from app.core.database import init_db, close_db, async_session_maker
 from app.core.redis import init_redis, close_redis
-from app.core.security import hash_password
+from app.core.audit import init_audit_writer, close_audit_writer
+from app.core.log_queue import init_logging, close_logging
+from app.core.security import hash_password_async
 from app.models.user import User, UserRole
 from app.models.mirror import Mirror, MirrorType, MirrorStatus
 from app.models.setting import Setting
 from app.api import health, auth, mirrors, admin, stats
 
+
+def _orjson_dumps(obj, **kwargs) -> str:
+    """structlog serializer backed by orjson."""
+    return orjson.dumps(obj, **kwargs).decode("utf-8")
+
+
 # Configure structured logging
 structlog.configure(
     processors=[
@@ -34,7 +44,7 @@ structlog.configure(
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
         structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer()
+        structlog.processors.JSONRenderer(serializer=_orjson_dumps)
     ],
     wrapper_class=structlog.stdlib.BoundLogger,
     context_class=dict,
@@ -49,29 +59,38 @@ logger = structlog.get_logger(__name__)
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan manager for startup/shutdown."""
     # Startup
+    init_logging()
     logger.info("Starting BSD Mirrors API", version=settings.VERSION)
     await init_db()
     await init_redis()
+    await init_audit_writer()
     logger.info("Database and Redis connections established")
 
     # Seed admin user and default mirrors if they don't exist
     async with async_session_maker() as session:
-        # Admin user
-        result = await session.execute(
-            select(User).where(User.username == settings.ADMIN_USERNAME)
+        # Admin user: bcrypt only runs when the row is actually missing; the
+        # upsert stays atomic against concurrent workers
+        admin_id = await session.scalar(
+            select(User.id).where(User.username == settings.ADMIN_USERNAME)
         )
-        admin_user = result.scalar_one_or_none()
-        if admin_user is None:
-            admin_user = User(
-                username=settings.ADMIN_USERNAME,
-                password_hash=hash_password(settings.ADMIN_PASSWORD),
-                role=UserRole.ADMIN,
-                is_active=True,
-            )
-            session.add(admin_user)
-            logger.info("Admin user created", username=settings.ADMIN_USERNAME)
-        else:
+        if admin_id is not None:
             logger.info("Admin user already exists", username=settings.ADMIN_USERNAME)
+        else:
+            result = await session.execute(
+                insert(User)
+                .values(
+                    username=settings.ADMIN_USERNAME,
+                    password_hash=await hash_password_async(settings.ADMIN_PASSWORD),
+                    role=UserRole.ADMIN,
+                    is_active=True,
+                )
+                .on_conflict_do_nothing(index_elements=["username"])
+                .returning(User.id)
+            )
+            if result.scalar_one_or_none() is not None:
+                logger.info("Admin user created", username=settings.ADMIN_USERNAME)
+            else:
+                logger.info("Admin user already exists", username=settings.ADMIN_USERNAME)
 
         # Default mirrors — upstream_url is updated from env on each startup
         default_mirrors = [
@@ -94,21 +113,27 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                 "local_path": "/data/mirrors/openbsd/pub/OpenBSD",
             },
         ]
+        # One lookup for all defaults, one multi-row INSERT for the missing ones
+        result = await session.execute(
+            select(Mirror.name, Mirror.upstream_url)
+            .where(Mirror.name.in_([m["name"] for m in default_mirrors]))
+        )
+        existing_mirrors = dict(result.all())
+        missing_mirrors = []
         for mirror_data in default_mirrors:
-            result = await session.execute(
-                select(Mirror).where(Mirror.name == mirror_data["name"])
-            )
-            existing = result.scalar_one_or_none()
-            if existing is None:
-                session.add(Mirror(
-                    **mirror_data,
-                    enabled=True,
-                    status=MirrorStatus.ACTIVE,
-                ))
-                logger.info("Default mirror created", name=mirror_data["name"])
-            elif existing.upstream_url != mirror_data["upstream_url"]:
-                existing.upstream_url = mirror_data["upstream_url"]
-                logger.info("Mirror upstream updated", name=mirror_data["name"], upstream=mirror_data["upstream_url"])
+            name = mirror_data["name"]
+            if name not in existing_mirrors:
+                missing_mirrors.append({**mirror_data, "enabled": True, "status": MirrorStatus.ACTIVE})
+                logger.info("Default mirror created", name=name)
+            elif existing_mirrors[name] != mirror_data["upstream_url"]:
+                await session.execute(
+                    update(Mirror)
+                    .where(Mirror.name == name)
+                    .values(upstream_url=mirror_data["upstream_url"])
+                )
+                logger.info("Mirror upstream updated", name=name, upstream=mirror_data["upstream_url"])
+        if missing_mirrors:
+            await session.execute(insert(Mirror), missing_mirrors)
 
         # Default settings
         default_settings = [
@@ -133,12 +158,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                 "description": "Run full sync when sync service starts",
             },
         ]
-        for setting_data in default_settings:
-            result = await session.execute(
-                select(Setting).where(Setting.key == setting_data["key"])
-            )
-            if result.scalar_one_or_none() is None:
-                session.add(Setting(**setting_data))
+        result = await session.execute(
+            select(Setting.key)
+            .where(Setting.key.in_([d["key"] for d in default_settings]))
+        )
+        existing_keys = set(result.scalars())
+        missing_settings = [d for d in default_settings if d["key"] not in existing_keys]
+        if missing_settings:
+            await session.execute(insert(Setting), missing_settings)
+            for setting_data in missing_settings:
                 logger.info("Default setting created", key=setting_data["key"])
 
         await session.commit()
@@ -147,9 +175,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     
     # Shutdown
     logger.info("Shutting down BSD Mirrors API")
+    await close_audit_writer()
     await close_db()
     await close_redis()
     logger.info("Connections closed")
+    close_logging()
 
 
 # Create FastAPI application
@@ -161,6 +191,7 @@ app = FastAPI(
     redoc_url="/api/redoc" if settings.DEBUG else None,
     openapi_url="/api/openapi.json" if settings.DEBUG else None,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -4,7 +4,7 @@ Audit log model for tracking admin actions.
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import String, DateTime, Text, Integer, ForeignKey, JSON
+from sqlalchemy import String, DateTime, Text, Integer, ForeignKey, JSON, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -15,15 +15,20 @@ class AuditLog(Base):
     """Audit log for tracking admin panel actions."""
     
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        # Newest-first (created_at, id) keyset pagination with optional action filter
+        Index("ix_audit_logs_created_id_action", text("created_at DESC"), text("id DESC"), "action"),
+        # Per-user recent activity; also covers the user_id foreign key
+        Index("ix_audit_logs_user_created", "user_id", text("created_at DESC")),
+    )
     
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     user_id: Mapped[Optional[int]] = mapped_column(
         Integer,
         ForeignKey("users.id", ondelete="SET NULL"),
-        nullable=True,
-        index=True
+        nullable=True
     )
-    action: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+    action: Mapped[str] = mapped_column(String(100), nullable=False)
     resource_type: Mapped[str] = mapped_column(String(50), nullable=False)
     resource_id: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     
@@ -36,8 +41,7 @@ class AuditLog(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     # Relationship
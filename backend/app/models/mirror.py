@@ -5,7 +5,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import String, Boolean, DateTime, BigInteger, Text, Enum as SQLEnum
+from sqlalchemy import String, Boolean, DateTime, BigInteger, Text, Index, text, Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -31,18 +31,24 @@ class Mirror(Base):
     """Mirror configuration and status."""
     
     __tablename__ = "mirrors"
+    __table_args__ = (
+        # Public listings only ever read enabled mirrors, ordered by name
+        Index("ix_mirrors_enabled_name", "name", postgresql_where=text("enabled")),
+    )
     
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
+    # VARCHAR + CHECK rather than native Postgres ENUM types: no type
+    # coercion on writes, and adding a value is a plain constraint change
     mirror_type: Mapped[MirrorType] = mapped_column(
-        SQLEnum(MirrorType, name="mirror_type"),
+        SQLEnum(MirrorType, name="mirror_type", native_enum=False, create_constraint=True, length=16),
         nullable=False
     )
     upstream_url: Mapped[str] = mapped_column(String(500), nullable=False)
     local_path: Mapped[str] = mapped_column(String(500), nullable=False)
     enabled: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     status: Mapped[MirrorStatus] = mapped_column(
-        SQLEnum(MirrorStatus, name="mirror_status"),
+        SQLEnum(MirrorStatus, name="mirror_status", native_enum=False, create_constraint=True, length=16),
         default=MirrorStatus.ACTIVE,
         nullable=False
     )
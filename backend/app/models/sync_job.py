@@ -5,12 +5,15 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import String, DateTime, BigInteger, Text, Integer, ForeignKey, Enum as SQLEnum
+from sqlalchemy import String, DateTime, BigInteger, Text, Integer, ForeignKey, Index, Enum as SQLEnum, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
 from app.core.database import Base
 
+# Postgres NOTIFY channel the sync service LISTENs on for new pending jobs
+SYNC_JOBS_CHANNEL = "sync_jobs_pending"
+
 
 class SyncStatus(str, Enum):
     """Status of a sync job."""
@@ -25,13 +28,28 @@ class SyncJob(Base):
     """Sync job history and status tracking."""
     
     __tablename__ = "sync_jobs"
+    __table_args__ = (
+        # Per-mirror sync history, newest first; INCLUDE lets the dashboard's
+        # recent-syncs columns come from an index-only scan
+        Index(
+            "ix_sync_jobs_mirror_created_covering",
+            "mirror_id",
+            text("created_at DESC"),
+            postgresql_include=["status", "completed_at", "bytes_transferred"],
+        ),
+        # Pending-job claim queue; the enum stores member names, hence 'PENDING'
+        Index(
+            "ix_sync_jobs_pending",
+            "id",
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+    )
     
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     mirror_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("mirrors.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     status: Mapped[SyncStatus] = mapped_column(
         SQLEnum(SyncStatus, name="sync_status"),
@@ -0,0 +1,150 @@
+"""
+Shared test configuration.
+"""
+import os
+import time
+
+# Required settings; must be in place before app.core.config is imported
+os.environ.setdefault("POSTGRES_PASSWORD", "test")
+os.environ.setdefault("REDIS_PASSWORD", "test")
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+os.environ.setdefault("ADMIN_PASSWORD", "test-admin-password")
+# Cheapest bcrypt work factor; tests hash and verify passwords freely
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.core.database import Base, get_db, get_db_ro
+from app.core.redis import get_redis
+
+
+class FakeRedis:
+    """In-memory stand-in for the few Redis commands the API uses."""
+
+    def __init__(self) -> None:
+        self.store: dict = {}
+        self.expiry: dict = {}
+
+    def _alive(self, key: str) -> bool:
+        deadline = self.expiry.get(key)
+        if deadline is not None and deadline <= time.monotonic():
+            self.store.pop(key, None)
+            self.expiry.pop(key, None)
+        return key in self.store
+
+    async def get(self, key: str):
+        if not self._alive(key):
+            return None
+        value = self.store[key]
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+    async def set(self, key: str, value, ex=None, nx=False):
+        if nx and self._alive(key):
+            return None
+        self.store[key] = value
+        self.expiry.pop(key, None)
+        if ex is not None:
+            self.expiry[key] = time.monotonic() + ex
+        return True
+
+    async def setex(self, key: str, seconds: int, value):
+        return await self.set(key, value, ex=seconds)
+
+    async def incr(self, key: str) -> int:
+        value = int(await self.get(key) or 0) + 1
+        self.store[key] = str(value)
+        return value
+
+    async def sadd(self, key: str, *members) -> int:
+        self._alive(key)  # clears an expired set first
+        members_set = self.store.setdefault(key, set())
+        added = len(set(members) - members_set)
+        members_set.update(members)
+        return added
+
+    async def smembers(self, key: str) -> set:
+        return set(self.store[key]) if self._alive(key) else set()
+
+    async def delete(self, *keys: str) -> int:
+        removed = 0
+        for key in keys:
+            if self._alive(key):
+                removed += 1
+            self.store.pop(key, None)
+            self.expiry.pop(key, None)
+        return removed
+
+    async def exists(self, *keys: str) -> int:
+        return sum(1 for key in keys if self._alive(key))
+
+    async def expire(self, key: str, seconds: int, nx: bool = False) -> bool:
+        if not self._alive(key) or (nx and key in self.expiry):
+            return False
+        self.expiry[key] = time.monotonic() + seconds
+        return True
+
+    async def publish(self, channel: str, message) -> int:
+        return 0
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Queues FakeRedis calls and runs them on execute()."""
+
+    def __init__(self, redis: FakeRedis) -> None:
+        self.redis = redis
+        self.calls: list = []
+
+    def __getattr__(self, name: str):
+        def queue(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+        return queue
+
+    async def execute(self) -> list:
+        calls, self.calls = self.calls, []
+        return [await getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in calls]
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self.calls = []
+
+
+@pytest.fixture
+async def session_maker():
+    """In-memory SQLite database with every model's table."""
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.fixture
+def fake_redis() -> FakeRedis:
+    """Fresh in-memory Redis for one test."""
+    return FakeRedis()
+
+
+@pytest.fixture
+async def client(session_maker, fake_redis):
+    """API client backed by the test database and in-memory Redis."""
+    async def override_get_db():
+        async with session_maker() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db_ro] = override_get_db
+    app.dependency_overrides[get_redis] = lambda: fake_redis
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+    app.dependency_overrides.clear()
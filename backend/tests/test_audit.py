@@ -0,0 +1,86 @@
+"""
+Tests for the batched audit log writer.
+"""
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import func, select
+
+from app.core import audit
+from app.core.config import settings
+from app.models.audit_log import AuditLog
+
+
+def entry(action: str = "mirror.update") -> dict:
+    """One audit row as the endpoints enqueue it."""
+    return {
+        "user_id": None,
+        "action": action,
+        "resource_type": "mirror",
+        "resource_id": None,
+        "details": None,
+        "ip_address": None,
+        "user_agent": None,
+        "created_at": datetime.now(timezone.utc),
+    }
+
+
+@pytest.fixture
+def writer_db(session_maker, monkeypatch):
+    """Point the writer's own sessions at the test database."""
+    monkeypatch.setattr(audit, "async_session_maker", session_maker)
+    return session_maker
+
+
+async def count_rows(session_maker) -> int:
+    async with session_maker() as session:
+        return await session.scalar(select(func.count()).select_from(AuditLog))
+
+
+async def test_batch_flushes_when_full(monkeypatch) -> None:
+    """A batch stops growing at AUDIT_BATCH_SIZE even with more queued."""
+    monkeypatch.setattr(settings, "AUDIT_BATCH_SIZE", 3)
+    queue = asyncio.Queue()
+    for _ in range(5):
+        queue.put_nowait(entry())
+
+    assert len(await audit._next_batch(queue)) == 3
+    assert queue.qsize() == 2
+
+
+async def test_batch_flushes_after_interval(monkeypatch) -> None:
+    """A partial batch is released once AUDIT_FLUSH_INTERVAL has passed."""
+    monkeypatch.setattr(settings, "AUDIT_FLUSH_INTERVAL", 0.05)
+    queue = asyncio.Queue()
+    queue.put_nowait(entry())
+    queue.put_nowait(entry())
+
+    batch = await asyncio.wait_for(audit._next_batch(queue), timeout=1)
+    assert len(batch) == 2
+
+
+async def test_shutdown_drains_queue(writer_db, monkeypatch) -> None:
+    """close_audit_writer writes everything queued before the sentinel."""
+    monkeypatch.setattr(settings, "AUDIT_FLUSH_INTERVAL", 10)
+    await audit.init_audit_writer()
+    for _ in range(3):
+        audit.enqueue_audit_log(entry())
+    await audit.close_audit_writer()
+
+    assert await count_rows(writer_db) == 3
+    assert audit.audit_queue is None
+
+
+async def test_failed_batch_does_not_stop_writer(writer_db, monkeypatch) -> None:
+    """A batch that fails to insert is logged and later batches still land."""
+    monkeypatch.setattr(settings, "AUDIT_FLUSH_INTERVAL", 0.01)
+    await audit.init_audit_writer()
+
+    # action is NOT NULL, so this batch's INSERT fails
+    audit.enqueue_audit_log(entry(action=None))
+    await asyncio.sleep(0.1)
+    audit.enqueue_audit_log(entry())
+    await audit.close_audit_writer()
+
+    assert await count_rows(writer_db) == 1
@@ -0,0 +1,70 @@
+"""
+Tests for audit log pagination.
+"""
+from datetime import datetime, timezone
+
+import pytest
+
+from app.main import app
+from app.api.auth import require_admin
+from app.models.audit_log import AuditLog
+from app.models.user import User, UserRole
+
+
+@pytest.fixture
+async def admin(session_maker):
+    """Admin user that require_admin resolves to."""
+    user = User(id=1, username="admin", password_hash="x", role=UserRole.ADMIN, is_active=True)
+    async with session_maker() as session:
+        session.add(user)
+        await session.commit()
+    app.dependency_overrides[require_admin] = lambda: user
+    return user
+
+
+async def test_audit_log_cursor_keeps_tied_timestamps(client, session_maker, admin) -> None:
+    """Rows sharing a created_at across a page boundary are all returned once."""
+    # One bulk action: every row gets the same transaction timestamp
+    logged_at = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+    async with session_maker() as session:
+        session.add_all(
+            AuditLog(user_id=1, action="mirror.update", resource_type="mirror", created_at=logged_at)
+            for _ in range(5)
+        )
+        await session.commit()
+
+    seen = []
+    params = {"limit": 2}
+    while True:
+        response = await client.get("/api/admin/audit-logs", params=params)
+        assert response.status_code == 200
+        seen.extend(log["id"] for log in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+        params = {"limit": 2, "cursor": cursor}
+
+    assert seen == [5, 4, 3, 2, 1]
+
+
+async def test_audit_log_cursor_is_url_safe(client, session_maker, admin) -> None:
+    """The raw X-Next-Cursor value works pasted into a URL unencoded."""
+    async with session_maker() as session:
+        session.add_all(
+            AuditLog(
+                user_id=1,
+                action="mirror.update",
+                resource_type="mirror",
+                created_at=datetime(2026, 1, 1, 12, 0, second, 123456, tzinfo=timezone.utc)
+            )
+            for second in range(3)
+        )
+        await session.commit()
+
+    first = await client.get("/api/admin/audit-logs?limit=2")
+    cursor = first.headers["X-Next-Cursor"]
+
+    # Built by hand, not via params=, so nothing gets percent-encoded
+    second = await client.get(f"/api/admin/audit-logs?limit=2&cursor={cursor}")
+    assert second.status_code == 200
+    assert [log["id"] for log in second.json()] == [1]
@@ -0,0 +1,85 @@
+"""
+Tests for login, rate limiting and the cached current user.
+"""
+import pytest
+
+from app.api.auth import USER_CACHE_PREFIX
+from app.core.config import settings
+from app.core.security import hash_password
+from app.models.user import User, UserRole
+
+PASSWORD = "correct horse battery staple"
+
+
+@pytest.fixture
+async def operator(session_maker):
+    """Active operator account with a known password."""
+    user = User(
+        username="operator",
+        password_hash=hash_password(PASSWORD),
+        role=UserRole.OPERATOR,
+        is_active=True,
+    )
+    async with session_maker() as session:
+        session.add(user)
+        await session.commit()
+    return user
+
+
+async def login(client, password: str = PASSWORD):
+    return await client.post(
+        "/api/auth/token",
+        data={"username": "operator", "password": password}
+    )
+
+
+async def test_successful_logins_are_not_rate_limited(client, operator) -> None:
+    """Repeated good logins within one window never hit the limit."""
+    for _ in range(settings.LOGIN_RATE_LIMIT + 2):
+        response = await login(client)
+        assert response.status_code == 200
+
+
+async def test_failed_logins_are_rate_limited(client, operator) -> None:
+    """Failures past LOGIN_RATE_LIMIT in one window are refused with 429."""
+    for _ in range(settings.LOGIN_RATE_LIMIT):
+        response = await login(client, password="wrong")
+        assert response.status_code == 401
+
+    response = await login(client, password="wrong")
+    assert response.status_code == 429
+
+
+async def test_success_resets_failed_attempts(client, operator) -> None:
+    """A good login clears earlier failures from the window."""
+    for _ in range(settings.LOGIN_RATE_LIMIT - 1):
+        await login(client, password="wrong")
+    assert (await login(client)).status_code == 200
+
+    for _ in range(settings.LOGIN_RATE_LIMIT - 1):
+        assert (await login(client, password="wrong")).status_code == 401
+
+
+async def test_me_is_served_from_the_user_cache(client, fake_redis, operator) -> None:
+    """The second /me for a token comes from Redis, not the database."""
+    token = (await login(client)).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    first = await client.get("/api/auth/me", headers=headers)
+    assert first.status_code == 200
+    assert any(key.startswith(USER_CACHE_PREFIX) for key in fake_redis.store)
+
+    second = await client.get("/api/auth/me", headers=headers)
+    assert second.json() == first.json()
+
+
+async def test_login_invalidates_cached_user(client, operator) -> None:
+    """A new login is visible through /me on an existing token at once."""
+    token = (await login(client)).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    before = (await client.get("/api/auth/me", headers=headers)).json()
+
+    assert (await login(client)).status_code == 200
+
+    after = (await client.get("/api/auth/me", headers=headers)).json()
+    assert after["last_login"] != before["last_login"]
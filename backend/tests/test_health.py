@@ -0,0 +1,19 @@
+"""
+Tests for the health check endpoints.
+"""
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+def test_health_check_returns_ok() -> None:
+    """GET /api/health serializes its timestamp and returns 200."""
+    # No context manager: the lifespan (DB, Redis) is not started
+    client = TestClient(app)
+    response = client.get("/api/health")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "healthy"
+    # Same representation as datetime.isoformat(), as before
+    assert body["timestamp"].endswith("+00:00")
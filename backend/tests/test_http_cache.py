@@ -0,0 +1,84 @@
+"""
+Tests for ETag handling and the Redis response cache.
+"""
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import update
+
+from app.core.http_cache import RESPONSE_CACHE_PREFIX
+from app.models.mirror import Mirror, MirrorStatus, MirrorType
+
+
+@pytest.fixture
+async def mirrors(session_maker):
+    """Two enabled mirrors with known sizes."""
+    async with session_maker() as session:
+        session.add_all([
+            Mirror(
+                name="FreeBSD",
+                mirror_type=MirrorType.FREEBSD,
+                upstream_url="rsync://example.org/FreeBSD/",
+                local_path="/data/mirrors/freebsd",
+                status=MirrorStatus.ACTIVE,
+                total_size_bytes=3_000_000_000,
+                file_count=1_000,
+            ),
+            Mirror(
+                name="NetBSD",
+                mirror_type=MirrorType.NETBSD,
+                upstream_url="rsync://example.org/NetBSD/",
+                local_path="/data/mirrors/netbsd",
+                status=MirrorStatus.ACTIVE,
+                total_size_bytes=2_000_000_000,
+                file_count=500,
+            ),
+        ])
+        await session.commit()
+
+
+async def test_cache_hit_matches_miss(client, fake_redis, mirrors) -> None:
+    """A response served from Redis is byte-identical to the one that filled it."""
+    miss = await client.get("/api/stats/overview")
+    assert miss.status_code == 200
+    assert any(key.startswith(RESPONSE_CACHE_PREFIX) for key in fake_redis.store)
+
+    hit = await client.get("/api/stats/overview")
+    assert hit.status_code == 200
+    assert hit.content == miss.content
+    assert hit.headers["etag"] == miss.headers["etag"]
+
+    totals = hit.json()["totals"]
+    assert totals["size_bytes"] == 5_000_000_000
+    assert totals["files_count"] == 1_500
+
+
+async def test_matching_etag_returns_304(client, mirrors) -> None:
+    """A client holding the current ETag gets an empty 304."""
+    first = await client.get("/api/mirrors/")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"].startswith("public")
+
+    for header in (etag, f"W/{etag}", f'"stale", {etag}', "*"):
+        again = await client.get("/api/mirrors/", headers={"If-None-Match": header})
+        assert again.status_code == 304
+        assert again.content == b""
+        assert again.headers["etag"] == etag
+
+
+async def test_mirror_change_moves_etag(client, session_maker, mirrors) -> None:
+    """Updating a mirror invalidates the old ETag."""
+    etag = (await client.get("/api/mirrors/")).headers["etag"]
+
+    async with session_maker() as session:
+        await session.execute(
+            update(Mirror)
+            .where(Mirror.name == "FreeBSD")
+            .values(updated_at=datetime(2030, 1, 1, tzinfo=timezone.utc))
+        )
+        await session.commit()
+
+    fresh = await client.get("/api/mirrors/", headers={"If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert fresh.headers["etag"] != etag
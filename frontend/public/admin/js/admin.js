@@ -61,7 +61,8 @@ const api = {
                 throw new Error(message);
             }
 
-            return response.status === 204 ? null : await response.json();
+            if (response.status === 204) return null;
+            return options.responseType === 'text' ? await response.text() : await response.json();
         } catch (error) {
             console.error('API Error:', error);
             throw error;
@@ -72,6 +73,10 @@ const api = {
         return this.request(endpoint);
     },
 
+    getText(endpoint) {
+        return this.request(endpoint, { responseType: 'text' });
+    },
+
     post(endpoint, data) {
         return this.request(endpoint, {
             method: 'POST',
@@ -812,7 +817,10 @@ const actions = {
 
     async viewSyncLogs(jobId) {
         try {
-            const job = await api.get(`/admin/sync-jobs/${jobId}/logs`);
+            const [job, output] = await Promise.all([
+                api.get(`/admin/sync-jobs/${jobId}`),
+                api.getText(`/admin/sync-jobs/${jobId}/logs`)
+            ]);
             const statusIcon = job.status === 'completed' ? '✅' : job.status === 'failed' ? '❌' : job.status === 'running' ? '🔄' : '⏳';
             const isRunning = job.status === 'running' || job.status === 'pending';
 
@@ -852,7 +860,7 @@ const actions = {
                 </div>` : ''}
                 <div class="form-group">
                     <label class="form-label">Rsync Output</label>
-                    <pre style="background: var(--bg-tertiary); padding: 12px; border-radius: 6px; overflow-x: auto; font-size: 12px; max-height: 400px; overflow-y: auto; white-space: pre-wrap; word-break: break-all;">${escapeHtml(job.rsync_output || (isRunning ? 'Sync is in progress... click Refresh to update.' : 'No output available.'))}</pre>
+                    <pre style="background: var(--bg-tertiary); padding: 12px; border-radius: 6px; overflow-x: auto; font-size: 12px; max-height: 400px; overflow-y: auto; white-space: pre-wrap; word-break: break-all;">${escapeHtml(output || (isRunning ? 'Sync is in progress... click Refresh to update.' : 'No output available.'))}</pre>
                 </div>
             `, `
                 ${isRunning ? `<button class="btn btn-primary btn-sm" data-action="viewSyncLogs" data-id="${job.id}">Refresh</button>` : ''}
@@ -5,17 +5,31 @@ Handles scheduled rsync synchronization of BSD mirrors.
 Polls for pending sync jobs created by the admin panel.
 """
 import asyncio
+import logging
 import os
+import queue
+import re
 import signal
 import subprocess
+import sys
 from datetime import datetime, timezone
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener
 
 from aiohttp import web
+import asyncpg
 from croniter import croniter
-from sqlalchemy import select, update, text
+from sqlalchemy import Row, insert, literal, select, update, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import redis.asyncio as aioredis
+import orjson
 import structlog
+import uvloop
+
+
+def _orjson_dumps(obj, **kwargs) -> str:
+    """structlog serializer backed by orjson."""
+    return orjson.dumps(obj, **kwargs).decode("utf-8")
+
 
 # Configure logging
 structlog.configure(
@@ -23,7 +37,7 @@ structlog.configure(
         structlog.stdlib.filter_by_level,
         structlog.stdlib.add_log_level,
         structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.JSONRenderer()
+        structlog.processors.JSONRenderer(serializer=_orjson_dumps)
     ],
     wrapper_class=structlog.stdlib.BoundLogger,
     context_class=dict,
@@ -33,8 +47,45 @@ structlog.configure(
 
 logger = structlog.get_logger(__name__)
 
-# How often to poll for pending jobs (seconds)
-POLL_INTERVAL = 10
+# Fallback poll for pending jobs (seconds); new jobs normally arrive via NOTIFY
+POLL_INTERVAL = 60
+
+# Pause after a job notification so a burst of triggers is claimed together (seconds)
+JOB_DEBOUNCE = 0.2
+
+# How often settings are re-read in case a pub/sub invalidation was missed (seconds)
+SETTINGS_RELOAD_INTERVAL = 3600
+
+# NOTIFY channel the API signals when it creates a pending sync job
+SYNC_JOBS_CHANNEL = "sync_jobs_pending"
+
+# Published by the API after settings are changed in the admin panel
+SETTINGS_INVALIDATE_CHANNEL = "settings:invalidate"
+
+# Per-attempt limit for the startup database readiness probe (seconds)
+DB_PROBE_TIMEOUT = 2.0
+
+# Seconds an rsync process gets to exit after SIGTERM before it is killed
+SHUTDOWN_GRACE_PERIOD = 10
+
+# /health response body; only the state fields are substituted per request
+_HEALTH_TEMPLATE = b'{"status":"healthy","running":%s,"syncing":%s,"active_syncs":%d}'
+
+# Only the end of the rsync log is read back; the --stats summary is printed
+# last. This tail is also what is stored as the job's rsync_output.
+RSYNC_TAIL_BYTES = 10000
+
+# rsync --stats summary lines we record, mapped to stats keys
+_STATS_RE = re.compile(
+    r"^(?P<key>Number of files|Number of regular files transferred|Total file size|Total transferred file size):\s*(?P<value>[\d,]+)",
+    re.MULTILINE,
+)
+_STATS_KEYS = {
+    "Number of files": "total_files",
+    "Number of regular files transferred": "files_transferred",
+    "Total file size": "total_size",
+    "Total transferred file size": "bytes_transferred",
+}
 
 
 class SyncConfig:
@@ -48,10 +99,18 @@ class SyncConfig:
 
     REDIS_HOST = os.getenv("REDIS_HOST", "redis")
     REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
+    REDIS_PASSWORD = os.getenv("REDIS_PASSWORD", "")
+
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+    # Full rsync output of the latest run per mirror
+    SYNC_LOG_DIR = os.getenv("SYNC_LOG_DIR", "/tmp/bsdmirror-sync")
 
     SYNC_SCHEDULE = os.getenv("SYNC_SCHEDULE", "0 4 * * *")
     SYNC_BANDWIDTH_LIMIT = int(os.getenv("SYNC_BANDWIDTH_LIMIT", "0"))
     SYNC_TIMEOUT = int(os.getenv("SYNC_TIMEOUT", "600"))
+    SYNC_MAX_CONCURRENT = int(os.getenv("SYNC_MAX_CONCURRENT", "2"))
+    # Adds whole-transfer progress lines to the rsync log
+    DEBUG_RSYNC = os.getenv("DEBUG_RSYNC", "false").lower() == "true"
 
     FREEBSD_ENABLED = os.getenv("FREEBSD_ENABLED", "true").lower() == "true"
     FREEBSD_UPSTREAM = os.getenv("FREEBSD_UPSTREAM", "rsync://ftp.freebsd.org/FreeBSD/")
@@ -66,6 +125,14 @@ class SyncConfig:
     def database_url(self) -> str:
         return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
 
+    @property
+    def listen_dsn(self) -> str:
+        return f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+
+    @property
+    def redis_url(self) -> str:
+        return f"redis://:{self.REDIS_PASSWORD}@{self.REDIS_HOST}:{self.REDIS_PORT}/0"
+
 
 config = SyncConfig()
 
@@ -75,38 +142,90 @@ class SyncService:
 
     def __init__(self):
         self.running = True
-        self.engine = create_async_engine(config.database_url, pool_size=5)
+        self.stop_event = asyncio.Event()
+        # Set by NOTIFY on new pending jobs (and on shutdown)
+        self.jobs_event = asyncio.Event()
+        self.listen_conn: asyncpg.Connection | None = None
+        self.stop_task: asyncio.Task | None = None
+        self.health_runner: web.AppRunner | None = None
+        self.engine = create_async_engine(
+            config.database_url,
+            pool_size=5,
+            max_overflow=10,
+            pool_pre_ping=True,
+            pool_recycle=1800,
+            connect_args={
+                # Reuse server-side prepared plans for the fixed set of
+                # job/mirror statements issued every cycle
+                "statement_cache_size": 200,
+                "prepared_statement_cache_size": 200,
+                "server_settings": {"jit": "off"},
+            },
+        )
         self.session_maker = async_sessionmaker(self.engine, expire_on_commit=False)
-        self.current_sync: Optional[asyncio.subprocess.Process] = None
+        # Running rsync processes, one per mirror being synced
+        self.current_sync: set[asyncio.subprocess.Process] = set()
+        self.sync_semaphore = asyncio.Semaphore(config.SYNC_MAX_CONCURRENT)
+        # Mirrors with a claimed pending job; claims are serialized by claim_lock
+        self.active_mirrors: set[int] = set()
+        self.claim_lock = asyncio.Lock()
         # Runtime settings (reloaded from DB)
         self.sync_schedule = config.SYNC_SCHEDULE
         self.sync_bandwidth_limit = config.SYNC_BANDWIDTH_LIMIT
         self.sync_timeout = config.SYNC_TIMEOUT
+        # rsync options, rebuilt only when the settings they depend on change
+        self.rsync_options: tuple[str, ...] = ()
+        self.rsync_options_key: tuple[int, int] | None = None
+        # Destinations already known to exist
+        self.created_dirs: set[str] = set()
 
     async def reload_settings(self) -> None:
         """Reload settings from the database settings table (if it exists)."""
         try:
             async with self.session_maker() as session:
-                result = await session.execute(select(Setting))
-                settings_rows = result.scalars().all()
+                result = await session.execute(select(Setting.key, Setting.value))
 
-                for s in settings_rows:
-                    if s.key == "sync_schedule" and s.value:
-                        self.sync_schedule = s.value
-                    elif s.key == "sync_bandwidth_limit" and s.value:
+                for key, value in result:
+                    if key == "sync_schedule" and value:
+                        self.sync_schedule = value
+                    elif key == "sync_bandwidth_limit" and value:
                         try:
-                            self.sync_bandwidth_limit = int(s.value)
+                            self.sync_bandwidth_limit = int(value)
                         except ValueError:
                             pass
-                    elif s.key == "sync_timeout" and s.value:
+                    elif key == "sync_timeout" and value:
                         try:
-                            self.sync_timeout = int(s.value)
+                            self.sync_timeout = int(value)
                         except ValueError:
                             pass
         except Exception as e:
             # Settings table may not exist yet — use env defaults
             logger.debug("Could not reload settings from DB", error=str(e))
 
+    def get_rsync_options(self) -> tuple[str, ...]:
+        """Return the rsync argv prefix for the current timeout and bandwidth settings."""
+        key = (self.sync_timeout, self.sync_bandwidth_limit)
+        if key != self.rsync_options_key:
+            options = [
+                "rsync",
+                "-rlptHz",
+                "--delete",
+                "--delete-delay",
+                "--delay-updates",
+                # Only the summary block; no per-file or progress output
+                "--info=stats2,progress0",
+                "--no-owner",
+                "--no-group",
+                f"--timeout={self.sync_timeout}",
+            ]
+            if config.DEBUG_RSYNC:
+                options.append("--info=progress2")
+            if self.sync_bandwidth_limit > 0:
+                options.append(f"--bwlimit={self.sync_bandwidth_limit}")
+            self.rsync_options = tuple(options)
+            self.rsync_options_key = key
+        return self.rsync_options
+
     async def run_rsync(
         self,
         source: str,
@@ -115,41 +234,33 @@ class SyncService:
     ) -> tuple[bool, str, dict]:
         """Run rsync command and capture output."""
 
-        # Build rsync command
-        cmd = [
-            "rsync",
-            "-rlptHz",
-            "--delete",
-            "--delete-delay",
-            "--delay-updates",
-            "--stats",
-            "--no-owner",
-            "--no-group",
-            f"--timeout={self.sync_timeout}",
-        ]
-
-        if self.sync_bandwidth_limit > 0:
-            cmd.append(f"--bwlimit={self.sync_bandwidth_limit}")
-
-        cmd.extend([source, destination])
+        cmd = (*self.get_rsync_options(), source, destination)
 
         logger.info("Starting rsync", mirror=mirror_name, source=source, destination=destination)
 
         try:
             # Ensure destination exists
-            os.makedirs(destination, exist_ok=True)
-
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.STDOUT
-            )
-            self.current_sync = process
-
-            stdout, _ = await process.communicate()
-            output = stdout.decode("utf-8", errors="replace")
+            if destination not in self.created_dirs:
+                await asyncio.to_thread(os.makedirs, destination, exist_ok=True)
+                self.created_dirs.add(destination)
+
+            # rsync writes straight to the log file; Python only reads the tail.
+            # This keeps memory bounded without relaying every line through a
+            # pipe, and the file gives live progress via tail -f.
+            log_path = os.path.join(config.SYNC_LOG_DIR, f"{mirror_name}.log")
+            with open(log_path, "wb") as log_file:
+                process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdout=log_file,
+                    stderr=asyncio.subprocess.STDOUT
+                )
+            self.current_sync.add(process)
 
-            self.current_sync = None
+            try:
+                await process.wait()
+            finally:
+                self.current_sync.discard(process)
+            output = self._read_log_tail(log_path)
 
             # Parse statistics from output
             stats = self._parse_rsync_stats(output)
@@ -165,139 +276,158 @@ class SyncService:
             logger.error("Rsync error", mirror=mirror_name, error=str(e))
             return False, str(e), {}
 
+    def _read_log_tail(self, log_path: str) -> str:
+        """Read the last RSYNC_TAIL_BYTES of an rsync log file."""
+        with open(log_path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - RSYNC_TAIL_BYTES))
+            return f.read().decode("utf-8", errors="replace")
+
     def _parse_rsync_stats(self, output: str) -> dict:
         """Parse rsync statistics from output."""
-        stats = {}
+        return {
+            _STATS_KEYS[m["key"]]: int(m["value"].replace(",", ""))
+            for m in _STATS_RE.finditer(output)
+        }
 
-        for line in output.split("\n"):
-            if "Number of files:" in line:
-                try:
-                    stats["total_files"] = int(line.split(":")[1].strip().split()[0].replace(",", ""))
-                except (IndexError, ValueError) as e:
-                    logger.debug("Failed to parse rsync total_files", line=line.strip(), error=str(e))
-            elif "Number of regular files transferred:" in line:
-                try:
-                    stats["files_transferred"] = int(line.split(":")[1].strip().replace(",", ""))
-                except (IndexError, ValueError) as e:
-                    logger.debug("Failed to parse rsync files_transferred", line=line.strip(), error=str(e))
-            elif "Total file size:" in line:
-                try:
-                    size_str = line.split(":")[1].strip().split()[0].replace(",", "")
-                    stats["total_size"] = int(size_str)
-                except (IndexError, ValueError) as e:
-                    logger.debug("Failed to parse rsync total_size", line=line.strip(), error=str(e))
-            elif "Total transferred file size:" in line:
-                try:
-                    size_str = line.split(":")[1].strip().split()[0].replace(",", "")
-                    stats["bytes_transferred"] = int(size_str)
-                except (IndexError, ValueError) as e:
-                    logger.debug("Failed to parse rsync bytes_transferred", line=line.strip(), error=str(e))
-
-        return stats
-
-    async def sync_mirror_job(self, job_id: int, mirror_id: int, name: str, upstream: str, local_path: str) -> None:
-        """Execute a sync for a pre-existing SyncJob record."""
+    async def _update_job_and_mirror(
+        self,
+        job_id: int,
+        job_values: dict,
+        mirror_id: int,
+        mirror_values: dict
+    ) -> None:
+        """Update a job and its mirror in a single statement (data-modifying CTE)."""
+        job_update = (
+            update(SyncJob.__table__)
+            .where(SyncJob.__table__.c.id == job_id)
+            .values(**job_values)
+            .returning(SyncJob.__table__.c.id)
+            .cte("job_update")
+        )
         async with self.session_maker() as session:
-            # Mark job as running
             await session.execute(
-                update(SyncJob)
-                .where(SyncJob.id == job_id)
-                .values(status=SyncStatus.RUNNING, started_at=datetime.now(timezone.utc))
-            )
-            # Update mirror status to syncing
-            await session.execute(
-                update(Mirror)
-                .where(Mirror.id == mirror_id)
-                .values(status=MirrorStatus.SYNCING, last_sync_started=datetime.now(timezone.utc))
+                update(Mirror.__table__)
+                .where(Mirror.__table__.c.id == mirror_id)
+                .values(**mirror_values)
+                .add_cte(job_update)
             )
             await session.commit()
 
-        logger.info("Executing sync job", job_id=job_id, mirror=name)
-
-        # Run rsync
-        success, output, stats = await self.run_rsync(upstream, local_path, name)
+    async def claim_pending_job(self, job_id: int | None = None, exclude_mirrors: set[int] | None = None):
+        """Claim a pending job (default: the oldest not for an excluded mirror),
+        marking it running and its mirror syncing.
+
+        FOR UPDATE SKIP LOCKED lets several sync workers poll the same table
+        without double-running a job. Returns the claimed row, or None.
+        """
+        jobs = SyncJob.__table__
+        mirrors = Mirror.__table__
+        now = datetime.now(timezone.utc)
+
+        if job_id is None:
+            next_job = select(jobs.c.id).where(jobs.c.status == SyncStatus.PENDING)
+            if exclude_mirrors:
+                next_job = next_job.where(jobs.c.mirror_id.not_in(exclude_mirrors))
+            job_id = (
+                next_job
+                .order_by(jobs.c.id.asc())
+                .limit(1)
+                .with_for_update(skip_locked=True)
+                .scalar_subquery()
+            )
+        job_claim = (
+            update(jobs)
+            .where(jobs.c.id == job_id, jobs.c.status == SyncStatus.PENDING)
+            .values(status=SyncStatus.RUNNING, started_at=now)
+            .returning(jobs.c.id, jobs.c.mirror_id)
+            .cte("job_claim")
+        )
 
-        # Update job and mirror status
         async with self.session_maker() as session:
-            now = datetime.now(timezone.utc)
-
-            # Update sync job
-            await session.execute(
-                update(SyncJob)
-                .where(SyncJob.id == job_id)
-                .values(
-                    status=SyncStatus.COMPLETED if success else SyncStatus.FAILED,
-                    completed_at=now,
-                    files_transferred=stats.get("files_transferred"),
-                    bytes_transferred=stats.get("bytes_transferred"),
-                    rsync_output=output[-10000:] if len(output) > 10000 else output,
-                    error_message=None if success else output[-1000:]
+            result = await session.execute(
+                update(mirrors)
+                .where(mirrors.c.id == job_claim.c.mirror_id)
+                .values(status=MirrorStatus.SYNCING, last_sync_started=now)
+                .returning(
+                    job_claim.c.id,
+                    job_claim.c.mirror_id,
+                    mirrors.c.name,
+                    mirrors.c.upstream_url,
+                    mirrors.c.local_path
                 )
             )
+            row = result.one_or_none()
+            await session.commit()
+        return row
 
-            # Update mirror status
-            mirror_update = {
-                "status": MirrorStatus.ACTIVE if success else MirrorStatus.ERROR,
-                "last_sync_completed": now if success else None,
-                "last_sync_error": None if success else output[-500:]
-            }
+    async def _execute_job(self, job_id: int, mirror_id: int, name: str, upstream: str, local_path: str) -> None:
+        """Run rsync for a job already marked running and record the outcome."""
+        logger.info("Executing sync job", job_id=job_id, mirror=name)
 
-            if success and stats.get("total_size"):
-                mirror_update["total_size_bytes"] = stats["total_size"]
-            if success and stats.get("total_files"):
-                mirror_update["file_count"] = stats["total_files"]
+        # Run rsync
+        success, output, stats = await self.run_rsync(upstream, local_path, name)
 
-            await session.execute(
-                update(Mirror)
-                .where(Mirror.id == mirror_id)
-                .values(**mirror_update)
-            )
-            await session.commit()
+        # Update job and mirror status
+        now = datetime.now(timezone.utc)
+        job_update = {
+            "status": SyncStatus.COMPLETED if success else SyncStatus.FAILED,
+            "completed_at": now,
+            "files_transferred": stats.get("files_transferred"),
+            "bytes_transferred": stats.get("bytes_transferred"),
+            "rsync_output": output,
+            "error_message": None if success else output[-1000:]
+        }
+
+        # Update mirror status. This write is never a no-op: status always
+        # leaves SYNCING, and the bumped updated_at is what invalidates the
+        # API's mirror ETags, so it is not guarded by IS DISTINCT FROM.
+        mirror_update = {
+            "status": MirrorStatus.ACTIVE if success else MirrorStatus.ERROR,
+            "last_sync_completed": now if success else None,
+            "last_sync_error": None if success else output[-500:]
+        }
+
+        if success and stats.get("total_size"):
+            mirror_update["total_size_bytes"] = stats["total_size"]
+        if success and stats.get("total_files"):
+            mirror_update["file_count"] = stats["total_files"]
+
+        await self._update_job_and_mirror(job_id, job_update, mirror_id, mirror_update)
 
         logger.info("Mirror sync finished", mirror=name, job_id=job_id, success=success)
 
-    async def sync_mirror(self, mirror_id: int, name: str, upstream: str, local_path: str) -> None:
-        """Create a new sync job and execute it (for scheduled syncs)."""
-        async with self.session_maker() as session:
-            sync_job = SyncJob(
-                mirror_id=mirror_id,
-                status=SyncStatus.PENDING,
-                triggered_by="scheduled"
-            )
-            session.add(sync_job)
-            await session.commit()
-            await session.refresh(sync_job)
-            job_id = sync_job.id
-
-        await self.sync_mirror_job(job_id, mirror_id, name, upstream, local_path)
-
     async def poll_pending_jobs(self) -> int:
         """Check for pending sync jobs and execute them. Returns count of jobs processed."""
         processed = 0
 
-        async with self.session_maker() as session:
-            result = await session.execute(
-                select(SyncJob, Mirror)
-                .join(Mirror, SyncJob.mirror_id == Mirror.id)
-                .where(SyncJob.status == SyncStatus.PENDING)
-                .order_by(SyncJob.id.asc())
-            )
-            pending_jobs = result.all()
-
-        for sync_job, mirror in pending_jobs:
-            if not self.running:
-                break
-
-            logger.info("Found pending sync job", job_id=sync_job.id, mirror=mirror.name)
-
-            await self.sync_mirror_job(
-                job_id=sync_job.id,
-                mirror_id=mirror.id,
-                name=mirror.name,
-                upstream=mirror.upstream_url,
-                local_path=mirror.local_path
-            )
-            processed += 1
+        async def worker() -> None:
+            nonlocal processed
+            # Claim one job at a time so started_at reflects when rsync begins
+            while self.running:
+                # Serialized so two workers never take jobs for the same mirror
+                async with self.claim_lock:
+                    job = await self.claim_pending_job(exclude_mirrors=self.active_mirrors)
+                    if job is None:
+                        return
+                    job_id, mirror_id, name, upstream, local_path = job
+                    self.active_mirrors.add(mirror_id)
+
+                logger.info("Found pending sync job", job_id=job_id, mirror=name)
+                try:
+                    await self._execute_job(job_id, mirror_id, name, upstream, local_path)
+                finally:
+                    self.active_mirrors.discard(mirror_id)
+                processed += 1
+
+        # Jobs for different mirrors run side by side, up to SYNC_MAX_CONCURRENT
+        results = await asyncio.gather(
+            *(worker() for _ in range(config.SYNC_MAX_CONCURRENT)),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Pending job worker failed", error=str(result))
 
         return processed
 
@@ -305,53 +435,120 @@ class SyncService:
         """Run sync for all enabled mirrors."""
         logger.info("Starting scheduled sync for all mirrors")
 
+        jobs = SyncJob.__table__
+        mirrors = Mirror.__table__
+
+        # Queue a pending job for every enabled mirror in one INSERT ... SELECT
+        job_insert = (
+            insert(jobs)
+            .from_select(
+                ["mirror_id", "status", "triggered_by"],
+                select(
+                    mirrors.c.id,
+                    literal(SyncStatus.PENDING, jobs.c.status.type),
+                    literal("scheduled")
+                ).where(mirrors.c.enabled == True)
+            )
+            .returning(jobs.c.id, jobs.c.mirror_id)
+            .cte("job_insert")
+        )
         async with self.session_maker() as session:
             result = await session.execute(
-                select(Mirror).where(Mirror.enabled == True)
+                select(job_insert.c.id, mirrors.c.name)
+                .join_from(job_insert, mirrors, mirrors.c.id == job_insert.c.mirror_id)
+                .order_by(job_insert.c.id)
             )
-            mirrors = result.scalars().all()
-
-        for mirror in mirrors:
-            if not self.running:
-                break
+            scheduled_jobs = result.all()
+            await session.commit()
 
-            await self.sync_mirror(
-                mirror_id=mirror.id,
-                name=mirror.name,
-                upstream=mirror.upstream_url,
-                local_path=mirror.local_path
-            )
+        async def guarded_sync(job: Row) -> None:
+            async with self.sync_semaphore:
+                if not self.running:
+                    return
+                # Jobs left pending at shutdown are picked up by the next poll
+                claimed = await self.claim_pending_job(job.id)
+                if claimed is None:
+                    return
+                await self._execute_job(*claimed)
+
+        # Mirrors are independent; sync up to SYNC_MAX_CONCURRENT at a time
+        results = await asyncio.gather(
+            *(guarded_sync(job) for job in scheduled_jobs),
+            return_exceptions=True
+        )
+        for job, result in zip(scheduled_jobs, results):
+            if isinstance(result, Exception):
+                logger.error("Scheduled sync failed", mirror=job.name, error=str(result))
+
+    async def settings_listener(self) -> None:
+        """Reload settings whenever the API announces a change."""
+        client = aioredis.from_url(config.redis_url, decode_responses=True)
+        try:
+            while self.running:
+                try:
+                    async with client.pubsub() as pubsub:
+                        await pubsub.subscribe(SETTINGS_INVALIDATE_CHANNEL)
+                        async for message in pubsub.listen():
+                            if message["type"] == "message":
+                                logger.info("Settings changed, reloading", keys=message["data"])
+                                await self.reload_settings()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.warning("Settings listener error, reconnecting", error=str(e))
+                    await self.sleep(POLL_INTERVAL)
+        finally:
+            await client.close()
+
+    def next_scheduled_run(self, base: datetime | None = None) -> datetime:
+        """Next cron fire time after base (default: now), as an aware UTC datetime."""
+        return croniter(self.sync_schedule, base or datetime.now(timezone.utc)).get_next(datetime)
+
+    def monotonic_deadline(self, when: datetime) -> float:
+        """Convert a wall-clock time into an event loop (monotonic) deadline."""
+        delay = (when - datetime.now(timezone.utc)).total_seconds()
+        return asyncio.get_running_loop().time() + max(0.0, delay)
 
     async def scheduler_loop(self) -> None:
-        """Main scheduler loop — polls for pending jobs every POLL_INTERVAL seconds
-        and runs scheduled syncs at the configured cron schedule."""
-        cron = croniter(self.sync_schedule, datetime.now())
-        next_run = cron.get_next(datetime)
-        settings_reload_interval = 30  # Reload settings every 30 cycles (~5 min)
-        poll_count = 0
+        """Main scheduler loop — runs pending jobs when NOTIFY announces them (or
+        every POLL_INTERVAL seconds as a fallback) and runs scheduled syncs at
+        the configured cron schedule."""
+        loop = asyncio.get_running_loop()
+        schedule = self.sync_schedule
+        next_run = self.next_scheduled_run()
+        # The wait is tracked on the monotonic clock so NTP steps cannot skip
+        # or repeat a run; the wall clock is only consulted when advancing
+        next_run_mono = self.monotonic_deadline(next_run)
+        # Changes arrive via pub/sub; the periodic reload is only a fallback
+        # for missed messages
+        last_settings_reload = loop.time()
 
         logger.info("Next scheduled sync", next_run=next_run.isoformat())
 
         while self.running:
             try:
-                # Sleep in short intervals to poll for pending jobs
-                await asyncio.sleep(POLL_INTERVAL)
+                # Wait for a job notification, falling back to a slow poll and
+                # waking early if the cron run is due sooner
+                await self.wait_for_jobs(min(POLL_INTERVAL, max(0.0, next_run_mono - loop.time())))
 
                 if not self.running:
                     break
 
-                poll_count += 1
+                if self.listen_conn is None or self.listen_conn.is_closed():
+                    await self.start_job_listener()
 
-                # Reload settings periodically to pick up admin panel changes
-                if poll_count % settings_reload_interval == 0:
-                    old_schedule = self.sync_schedule
+                # Reload settings periodically in case an invalidation was missed
+                if loop.time() - last_settings_reload >= SETTINGS_RELOAD_INTERVAL:
                     await self.reload_settings()
-                    # If schedule changed, recalculate next run
-                    if self.sync_schedule != old_schedule:
-                        logger.info("Sync schedule changed", old=old_schedule, new=self.sync_schedule)
-                        cron = croniter(self.sync_schedule, datetime.now())
-                        next_run = cron.get_next(datetime)
-                        logger.info("Next scheduled sync recalculated", next_run=next_run.isoformat())
+                    last_settings_reload = loop.time()
+
+                # If schedule changed, recalculate next run
+                if self.sync_schedule != schedule:
+                    logger.info("Sync schedule changed", old=schedule, new=self.sync_schedule)
+                    schedule = self.sync_schedule
+                    next_run = self.next_scheduled_run()
+                    next_run_mono = self.monotonic_deadline(next_run)
+                    logger.info("Next scheduled sync recalculated", next_run=next_run.isoformat())
 
                 # Poll for manually triggered pending jobs
                 processed = await self.poll_pending_jobs()
@@ -359,8 +556,7 @@ class SyncService:
                     logger.info("Processed pending jobs", count=processed)
 
                 # Check if cron schedule is due
-                now = datetime.now()
-                if now >= next_run:
+                if loop.time() >= next_run_mono:
                     logger.info("Cron schedule triggered", schedule=self.sync_schedule)
 
                     # Reload settings before scheduled sync
@@ -368,64 +564,127 @@ class SyncService:
 
                     await self.run_scheduled_sync()
 
-                    # Advance to next cron time
-                    cron = croniter(self.sync_schedule, datetime.now())
-                    next_run = cron.get_next(datetime)
+                    # Advance to next cron time; never before the slot just run
+                    next_run = self.next_scheduled_run(max(datetime.now(timezone.utc), next_run))
+                    next_run_mono = self.monotonic_deadline(next_run)
                     logger.info("Next scheduled sync", next_run=next_run.isoformat())
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error("Scheduler loop error", error=str(e))
-                await asyncio.sleep(POLL_INTERVAL)
+                await self.sleep(POLL_INTERVAL)
 
     async def health_handler(self, request: web.Request) -> web.Response:
         """Health check endpoint handler."""
-        return web.json_response({
-            "status": "healthy",
-            "running": self.running,
-            "syncing": self.current_sync is not None
-        })
+        return web.Response(
+            body=_HEALTH_TEMPLATE % (
+                b"true" if self.running else b"false",
+                b"true" if self.current_sync else b"false",
+                len(self.current_sync)
+            ),
+            content_type="application/json"
+        )
 
     async def start_health_server(self) -> None:
         """Start the health check HTTP server."""
         app = web.Application()
         app.router.add_get("/health", self.health_handler)
 
-        runner = web.AppRunner(app)
-        await runner.setup()
-        site = web.TCPSite(runner, "0.0.0.0", 8001)
+        self.health_runner = web.AppRunner(app)
+        await self.health_runner.setup()
+        site = web.TCPSite(self.health_runner, "0.0.0.0", 8001)
         await site.start()
         logger.info("Health server started on port 8001")
 
-    def handle_signal(self, signum: int, frame) -> None:
-        """Handle shutdown signals."""
+    def on_job_notify(self, connection, pid: int, channel: str, payload: str) -> None:
+        """asyncpg NOTIFY callback: wake the scheduler to pick up the new job."""
+        self.jobs_event.set()
+
+    async def start_job_listener(self) -> None:
+        """LISTEN for new sync jobs on a dedicated connection; polling covers failures."""
+        try:
+            self.listen_conn = await asyncpg.connect(config.listen_dsn)
+            await self.listen_conn.add_listener(SYNC_JOBS_CHANNEL, self.on_job_notify)
+            logger.info("Listening for sync job notifications", channel=SYNC_JOBS_CHANNEL)
+        except Exception as e:
+            logger.warning("Could not listen for sync jobs, polling only", error=str(e))
+            self.listen_conn = None
+
+    async def wait_for_jobs(self, timeout: float) -> None:
+        """Sleep until a job is announced, shutdown is requested, or timeout passes."""
+        try:
+            await asyncio.wait_for(self.jobs_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        else:
+            # Let the rest of a burst of triggers land before polling
+            await self.sleep(JOB_DEBOUNCE)
+        self.jobs_event.clear()
+
+    async def sleep(self, seconds: float) -> None:
+        """Sleep, returning early if shutdown is requested."""
+        try:
+            await asyncio.wait_for(self.stop_event.wait(), seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    def handle_signal(self, signum: int) -> None:
+        """Handle shutdown signals (runs on the event loop)."""
         logger.info("Received signal, shutting down", signal=signum)
         self.running = False
-
-        if self.current_sync:
-            self.current_sync.terminate()
+        self.stop_event.set()
+        self.jobs_event.set()
+        if self.stop_task is None:
+            self.stop_task = asyncio.create_task(self.stop_syncs())
+
+    async def stop_syncs(self) -> None:
+        """Terminate running rsync processes, killing any that linger."""
+        processes = list(self.current_sync)
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            try:
+                await asyncio.wait_for(process.wait(), SHUTDOWN_GRACE_PERIOD)
+            except asyncio.TimeoutError:
+                logger.warning("Rsync did not exit after SIGTERM, killing", pid=process.pid)
+                process.kill()
+
+    def start_log_listener(self) -> None:
+        """Route root logger output through a background queue listener."""
+        log_queue = queue.SimpleQueue()
+        root = logging.getLogger()
+        root.handlers = [QueueHandler(log_queue)]
+        root.setLevel(config.LOG_LEVEL.upper())
+        self.log_listener = QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+        self.log_listener.start()
 
     async def run(self) -> None:
         """Main entry point."""
+        self.start_log_listener()
         logger.info("Starting BSD Mirrors Sync Service")
 
         # Set up signal handlers
-        signal.signal(signal.SIGTERM, self.handle_signal)
-        signal.signal(signal.SIGINT, self.handle_signal)
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(signum, self.handle_signal, signum)
+
+        os.makedirs(config.SYNC_LOG_DIR, exist_ok=True)
 
         # Start health server
         await self.start_health_server()
 
-        # Wait for database to be ready
+        # Wait for database to be ready. A successful probe leaves its
+        # connection in the pool for the first real query to reuse.
         for i in range(30):
             try:
-                async with self.engine.connect() as conn:
-                    await conn.execute(select(1))
-                    break
+                async with asyncio.timeout(DB_PROBE_TIMEOUT):
+                    async with self.engine.connect() as conn:
+                        await conn.execute(text("SELECT 1"))
+                break
             except Exception:
                 logger.info("Waiting for database...", attempt=i+1)
-                await asyncio.sleep(2)
+                await self.sleep(2)
 
         # Load settings from database
         await self.reload_settings()
@@ -442,19 +701,34 @@ class SyncService:
         if os.getenv("SYNC_ON_STARTUP", "false").lower() == "true":
             await self.run_scheduled_sync()
 
-        # Start scheduler
+        # Start scheduler, with settings changes pushed over Redis and new
+        # jobs announced over Postgres NOTIFY
+        await self.start_job_listener()
+        listener_task = asyncio.create_task(self.settings_listener())
         await self.scheduler_loop()
-
+        listener_task.cancel()
+        await asyncio.gather(listener_task, return_exceptions=True)
+        if self.listen_conn is not None:
+            await self.listen_conn.close()
+
+        if self.stop_task is not None:
+            await self.stop_task
+        if self.health_runner is not None:
+            await self.health_runner.cleanup()
         await self.engine.dispose()
         logger.info("Sync service stopped")
+        self.log_listener.stop()
 
 
 # Import models (for SQLAlchemy metadata)
 # NOTE: These must match the backend's model definitions exactly,
-# including using the same PostgreSQL enum types.
+# including using the same column and enum storage types. They cannot be
+# imported from app.models: the sync image is built from ./sync alone and
+# does not contain the backend package.
 import enum as python_enum
 from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, BigInteger, Enum, ForeignKey
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.sql import func
 
 Base = declarative_base()
 
@@ -482,12 +756,13 @@ class Mirror(Base):
     upstream_url = Column(String(500))
     local_path = Column(String(500))
     enabled = Column(Boolean, default=True)
-    status = Column(Enum(MirrorStatus, name="mirror_status"), default=MirrorStatus.ACTIVE)
+    status = Column(Enum(MirrorStatus, name="mirror_status", native_enum=False, length=16), default=MirrorStatus.ACTIVE)
     last_sync_started = Column(DateTime(timezone=True))
     last_sync_completed = Column(DateTime(timezone=True))
     last_sync_error = Column(Text)
     total_size_bytes = Column(BigInteger)
     file_count = Column(BigInteger)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
 class SyncJob(Base):
     __tablename__ = "sync_jobs"
@@ -512,6 +787,8 @@ class Setting(Base):
     description = Column(Text)
 
 
+# Container entry point: the Dockerfile runs `python -m sync_service`,
+# which executes this module rather than __main__.py
 if __name__ == "__main__":
     service = SyncService()
-    asyncio.run(service.run())
+    asyncio.run(service.run(), loop_factory=uvloop.new_event_loop)
@@ -0,0 +1,72 @@
+"""
+Tests for the SKIP LOCKED pending job claim.
+
+These need a real PostgreSQL: SQLite has neither FOR UPDATE SKIP LOCKED nor
+data-modifying CTEs. Point POSTGRES_* at a disposable database and set
+SYNC_TEST_DATABASE=1 to run them; the tables are created and dropped here.
+"""
+import asyncio
+import os
+
+import pytest
+
+if os.getenv("SYNC_TEST_DATABASE") != "1":
+    pytest.skip("SYNC_TEST_DATABASE=1 not set", allow_module_level=True)
+
+from sqlalchemy import func, insert, select
+
+from sync_service import Base, Mirror, MirrorStatus, SyncJob, SyncService, SyncStatus
+
+
+@pytest.fixture
+async def service():
+    """A sync service with two mirrors and two pending jobs for each."""
+    service = SyncService()
+    async with service.engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(insert(Mirror), [
+            {"id": 1, "name": "FreeBSD", "upstream_url": "rsync://example.org/FreeBSD/",
+             "local_path": "/data/mirrors/freebsd", "status": MirrorStatus.ACTIVE},
+            {"id": 2, "name": "NetBSD", "upstream_url": "rsync://example.org/NetBSD/",
+             "local_path": "/data/mirrors/netbsd", "status": MirrorStatus.ACTIVE},
+        ])
+        await conn.execute(insert(SyncJob), [
+            {"mirror_id": mirror_id, "status": SyncStatus.PENDING}
+            for mirror_id in (1, 2, 1, 2)
+        ])
+    yield service
+    async with service.engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await service.engine.dispose()
+
+
+async def test_concurrent_claims_never_share_a_job(service) -> None:
+    """Racing workers each get a different job, and every job is claimed once."""
+    rows = await asyncio.gather(*(service.claim_pending_job() for _ in range(6)))
+    claimed = [row.id for row in rows if row is not None]
+
+    assert len(claimed) == len(set(claimed))
+    async with service.session_maker() as session:
+        pending = await session.scalar(
+            select(func.count()).select_from(SyncJob).where(SyncJob.status == SyncStatus.PENDING)
+        )
+    assert len(claimed) + pending == 4
+
+
+async def test_claim_marks_job_running_and_mirror_syncing(service) -> None:
+    """A claim updates both rows and skips excluded mirrors."""
+    row = await service.claim_pending_job(exclude_mirrors={1})
+    assert row.mirror_id == 2
+    assert row.name == "NetBSD"
+
+    async with service.session_maker() as session:
+        job = await session.get(SyncJob, row.id)
+        mirror = await session.get(Mirror, 2)
+    assert job.status == SyncStatus.RUNNING
+    assert job.started_at is not None
+    assert mirror.status == MirrorStatus.SYNCING
+
+
+async def test_claim_returns_none_when_nothing_pending(service) -> None:
+    """With every mirror excluded there is nothing to claim."""
+    assert await service.claim_pending_job(exclude_mirrors={1, 2}) is None